@@ -6,6 +6,8 @@ from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
+from fastapi_cache import FastAPICache
+from fastapi_cache.backends.inmemory import InMemoryBackend
 from contextlib import asynccontextmanager
 import logging
 
@@ -32,13 +34,18 @@ async def lifespan(app: FastAPI):
     logger.info(f"Version: {default_api_config.version}")
     logger.info(f"Documentation: http://{default_api_config.host}:{default_api_config.port}/docs")
     logger.info("="*60)
-    
+
     yield
     
     # Shutdown
     logger.info("Shutting down API...")
 
 
+# In-memory response cache for the read-mostly aggregate endpoints.
+# Initialized at import (not in lifespan) so ASGI-transport tests that
+# skip startup events still get a working cache.
+FastAPICache.init(InMemoryBackend(), prefix="api-cache")
+
 # Create FastAPI app with lifespan
 app = FastAPI(
     title=default_api_config.title,
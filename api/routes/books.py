@@ -2,8 +2,10 @@
 Book endpoints
 """
 from fastapi import APIRouter, Depends, HTTPException, Query, status, Request
+from fastapi_cache.decorator import cache
 from typing import Optional
 from motor.motor_asyncio import AsyncIOMotorDatabase
+from bson import ObjectId
 from urllib.parse import unquote
 
 from api.dependencies import get_db, get_current_api_key, limiter, get_rate_limit
@@ -16,6 +18,10 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/books", tags=["Books"])
 
+# Fields clients may request via ?fields= - everything the response model
+# exposes except id, which is always returned
+PROJECTABLE_FIELDS = set(APIBookResponse.model_fields) - {'id'}
+
 
 @router.get(
     "",
@@ -44,6 +50,18 @@ async def get_books(
         le=default_api_config.max_page_size,
         description=f"Items per page (max {default_api_config.max_page_size})"
     ),
+    after_id: Optional[str] = Query(
+        None,
+        description="Keyset cursor: return books after this id (use next_cursor from the previous response; preferred over page for deep pagination)"
+    ),
+    count_only: bool = Query(
+        False,
+        description="Return pagination metadata only (total, total_pages) without fetching any books"
+    ),
+    fields: Optional[str] = Query(
+        None,
+        description="Comma-separated subset of book fields to return (e.g. fields=category,price_incl_tax,rating); id is always included"
+    ),
     db: AsyncIOMotorDatabase = Depends(get_db),
     api_key: str = Depends(get_current_api_key)
 ):
@@ -72,7 +90,25 @@ async def get_books(
                 status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
                 detail="min_price cannot be greater than max_price"
             )
-        
+
+        # Validate keyset cursor
+        if after_id is not None and not ObjectId.is_valid(after_id):
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+                detail="after_id must be a valid ObjectId"
+            )
+
+        # Validate field projection against the allowlist
+        projection = None
+        if fields is not None:
+            projection = [field.strip() for field in fields.split(',') if field.strip()]
+            unknown = [field for field in projection if field not in PROJECTABLE_FIELDS]
+            if unknown:
+                raise HTTPException(
+                    status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+                    detail=f"Unknown fields: {', '.join(unknown)}"
+                )
+
         # Call service
         result = await BookService.get_books(
             db=db,
@@ -82,7 +118,10 @@ async def get_books(
             rating=rating,
             sort_by=sort_by,
             page=page,
-            page_size=page_size
+            page_size=page_size,
+            after_id=after_id,
+            count_only=count_only,
+            projection=projection
         )
         
         logger.info(f"Books endpoint: returned {len(result['data'])} books (page {page})")
@@ -232,6 +271,7 @@ async def get_book_by_id(
     }
 )
 @limiter.limit(get_rate_limit())
+@cache(expire=60)
 async def get_categories(
     request: Request,
 
@@ -2,6 +2,7 @@
 Change log endpoints
 """
 from fastapi import APIRouter, Depends, HTTPException, Query, status, Request
+from fastapi_cache.decorator import cache
 from typing import Optional
 from motor.motor_asyncio import AsyncIOMotorDatabase
 from datetime import datetime
@@ -164,6 +165,7 @@ async def get_recent_changes(
     }
 )
 @limiter.limit(get_rate_limit())
+@cache(expire=60)
 async def get_change_statistics(
     request: Request,
     db: AsyncIOMotorDatabase = Depends(get_db),
@@ -2,6 +2,7 @@
 Health check endpoint
 """
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi_cache.decorator import cache
 from motor.motor_asyncio import AsyncIOMotorDatabase
 from datetime import datetime, timezone, timedelta
 
@@ -26,6 +27,7 @@ router = APIRouter(tags=["Health"])
         503: {"description": "Service unavailable"}
     }
 )
+@cache(expire=60)
 async def health_check(db: AsyncIOMotorDatabase = Depends(get_db)):
     """
     Health check endpoint.
@@ -6,7 +6,9 @@ from typing import Optional, List
 import secrets
 import hashlib
 import logging
+import time
 from repositories.api_key_repository import (
+    KEY_HASH_PREFIX_LEN,
     save_api_key,
     get_api_key_by_hash,
     get_all_api_keys,
@@ -16,6 +18,13 @@ from models.api_key import APIKeyModel
 
 logger = logging.getLogger(__name__)
 
+# Short-lived cache of validated key hashes - turns the per-request DB
+# lookup into a dict get. Only positive results are cached so a key
+# created moments after a failed attempt works immediately.
+_validation_cache: dict = {}
+_VALIDATION_TTL_SECONDS = 30.0
+_VALIDATION_CACHE_MAX = 1024
+
 
 class APIKeyService:
     """Service for API key operations"""
@@ -64,6 +73,7 @@ class APIKeyService:
             # Create model
             api_key = APIKeyModel(
                 key_hash=key_hash,
+                key_hash_prefix=key_hash[:KEY_HASH_PREFIX_LEN],
                 name=name
             )
             
@@ -100,8 +110,21 @@ class APIKeyService:
         """
         try:
             key_hash = APIKeyService.hash_api_key(key)
+
+            now = time.monotonic()
+            cached = _validation_cache.get(key_hash)
+            if cached is not None and cached > now:
+                return True
+
             api_key = await get_api_key_by_hash(db, key_hash)
-            return api_key is not None
+
+            if api_key is not None:
+                if len(_validation_cache) >= _VALIDATION_CACHE_MAX:
+                    _validation_cache.clear()
+                _validation_cache[key_hash] = now + _VALIDATION_TTL_SECONDS
+                return True
+
+            return False
         except Exception as e:
             logger.error(f"Error validating API key: {e}")
             return False
@@ -131,4 +154,11 @@ class APIKeyService:
         Returns:
             True if successful
         """
-        return await deactivate_api_key(db, key_id)
\ No newline at end of file
+        revoked = await deactivate_api_key(db, key_id)
+
+        if revoked:
+            # Only the key id is known here, not its hash - drop the whole
+            # cache so the revoked key stops validating right away
+            _validation_cache.clear()
+
+        return revoked
\ No newline at end of file
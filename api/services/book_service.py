@@ -9,10 +9,14 @@ from bson import ObjectId
 
 logger = logging.getLogger(__name__)
 
+# Case-insensitive English collation - lets category equality filters run
+# as an index scan on the collated category index instead of a regex scan
+CATEGORY_COLLATION = {'locale': 'en', 'strength': 2}
+
 
 class BookService:
     """Service for book-related operations"""
-    
+
     @staticmethod
     def build_book_filters(
         category: Optional[str] = None,
@@ -35,8 +39,9 @@ class BookService:
         filters = {}
         
         if category:
-            # Case-insensitive category search
-            filters['category'] = {'$regex': f'^{category}$', '$options': 'i'}
+            # Plain equality - case-insensitivity comes from querying with
+            # CATEGORY_COLLATION, not from a regex the index can't use
+            filters['category'] = category
         
         if min_price is not None or max_price is not None:
             price_filter = {}
@@ -84,11 +89,14 @@ class BookService:
         rating: Optional[int] = None,
         sort_by: Optional[str] = None,
         page: int = 1,
-        page_size: int = 50
+        page_size: int = 50,
+        after_id: Optional[str] = None,
+        count_only: bool = False,
+        projection: Optional[List[str]] = None
     ) -> Dict[str, Any]:
         """
         Get paginated, filtered, and sorted books
-        
+
         Args:
             db: Database connection
             category: Filter by category
@@ -98,43 +106,86 @@ class BookService:
             sort_by: Sort field
             page: Page number (1-indexed)
             page_size: Items per page
-            
+            after_id: Keyset cursor - return books with _id greater than
+                this; jumps straight to the page via the _id index instead
+                of skip-walking, so deep pages stay O(page_size)
+            count_only: Return pagination metadata only, skipping the
+                document fetch (empty data list)
+            projection: Field names to return; applied server-side so
+                only the requested fields cross the wire (None = all)
+
         Returns:
             Dictionary with pagination info and book data
         """
         try:
             # Build filters
             filters = BookService.build_book_filters(category, min_price, max_price, rating)
-            
-            # Get total count
-            total = await db.books.count_documents(filters)
-            
+            collation = CATEGORY_COLLATION if category else None
+
+            # Get total count; unfiltered count-only requests can answer
+            # from collection metadata instead of scanning
+            if count_only and not filters:
+                total = await db.books.estimated_document_count()
+            elif collation is not None:
+                # count_documents is a $match/$count aggregate server-side;
+                # issue it directly so the collation applies to the count
+                count_result = await db.books.aggregate(
+                    [{'$match': filters}, {'$count': 'n'}],
+                    collation=collation
+                ).to_list(length=1)
+                total = count_result[0]['n'] if count_result else 0
+            else:
+                total = await db.books.count_documents(filters)
+
             # Calculate pagination
             total_pages = ceil(total / page_size) if total > 0 else 1
-            skip = (page - 1) * page_size
-            
-            # Build sort criteria
-            sort_criteria = BookService.build_sort_criteria(sort_by)
-            
-            # Query database
-            cursor = db.books.find(filters).sort(sort_criteria).skip(skip).limit(page_size)
+
+            if count_only:
+                logger.info(f"Count-only books query: {total} books, {total_pages} pages")
+                return {
+                    'total': total,
+                    'page': page,
+                    'page_size': page_size,
+                    'total_pages': total_pages,
+                    'next_cursor': None,
+                    'data': []
+                }
+
+            # Server-side projection: smaller BSON per document (_id stays
+            # included, it becomes the id field below)
+            mongo_projection = {field: 1 for field in projection} if projection else None
+
+            if after_id is not None:
+                # Keyset mode: index jump on _id, no skip scan (fixed
+                # _id-ascending order so the cursor is stable)
+                filters['_id'] = {'$gt': ObjectId(after_id)}
+                cursor = db.books.find(filters, mongo_projection, collation=collation).sort('_id', 1).limit(page_size)
+            else:
+                # Offset mode: kept for page-number compatibility
+                skip = (page - 1) * page_size
+                sort_criteria = BookService.build_sort_criteria(sort_by)
+                cursor = db.books.find(filters, mongo_projection, collation=collation).sort(sort_criteria).skip(skip).limit(page_size)
+
             books = await cursor.to_list(length=page_size)
-            
+
+            next_cursor = str(books[-1]['_id']) if after_id is not None and books else None
+
             for book in books:
                 book['id'] = str(book.pop('_id'))
                 book.pop('raw_html_snapshot', None)  # Don't send HTML in API
                 book.pop('content_hash', None)  # Internal field
-            
+
             logger.info(f"Retrieved {len(books)} books (page {page}/{total_pages}, total: {total})")
-            
+
             return {
                 'total': total,
                 'page': page,
                 'page_size': page_size,
                 'total_pages': total_pages,
+                'next_cursor': next_cursor,
                 'data': books
             }
-            
+
         except Exception as e:
             logger.error(f"Error fetching books: {e}")
             raise
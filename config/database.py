@@ -23,7 +23,14 @@ class DatabaseConfig:
         
     async def connect_async(self):
         try:
-            self.async_client = AsyncIOMotorClient(self.mongodb_uri)
+            # Wire-protocol compression cuts network bytes for the large
+            # find().to_list() payloads; unsupported compressors are ignored,
+            # zlib is always available in the stdlib
+            self.async_client = AsyncIOMotorClient(
+                self.mongodb_uri,
+                compressors="snappy,zstd,zlib",
+                zlibCompressionLevel=6
+            )
             await self.async_client.admin.command('ping')
             logger.info(f"Connected to MongoDB (Async): {self.db_name}")
             return self.async_client[self.db_name]
@@ -33,7 +40,11 @@ class DatabaseConfig:
     
     def connect_sync(self):
         try:
-            self.sync_client = MongoClient(self.mongodb_uri)
+            self.sync_client = MongoClient(
+                self.mongodb_uri,
+                compressors="snappy,zstd,zlib",
+                zlibCompressionLevel=6
+            )
             self.sync_client.admin.command('ping')
             logger.info(f"Connected to MongoDB (Sync): {self.db_name}")
             return self.sync_client[self.db_name]
@@ -1,9 +1,11 @@
 from .simple_scraper import get_all_book_urls, scrape_book_detail
-from .async_scraper import get_all_book_urls_async, scrape_multiple_books
+from .async_scraper import get_all_book_urls_async, get_all_book_listings_async, scrape_multiple_books, scrape_multiple_books_iter
 
 __all__ = [
-    'get_all_book_urls', 
+    'get_all_book_urls',
     'scrape_book_detail',
     'get_all_book_urls_async',
-    'scrape_multiple_books'
+    'get_all_book_listings_async',
+    'scrape_multiple_books',
+    'scrape_multiple_books_iter'
 ]
\ No newline at end of file
@@ -6,7 +6,7 @@ from bs4 import BeautifulSoup
 import hashlib
 from datetime import datetime, timezone, timedelta
 import asyncio
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 from tenacity import (retry, stop_after_attempt, wait_exponential, retry_if_exception_type,before_sleep_log)
 
 import logging
@@ -71,6 +71,25 @@ def generate_content_hash(book_data: dict) -> str:
     return hashlib.sha256(hash_string.encode()).hexdigest()
 
 
+def generate_listing_hash(price_text: str, availability_text: str, rating_class: str) -> str:
+    """
+    Generate SHA256 hash of the fields visible on a catalog listing row
+
+    A stable listing hash for an already-known book means its detail page
+    cannot have a monitored change, so the detail fetch can be skipped.
+
+    Args:
+        price_text: Price text from the listing row
+        availability_text: Availability text from the listing row
+        rating_class: Star-rating class from the listing row
+
+    Returns:
+        SHA256 hash string
+    """
+    hash_string = f"{price_text}|{availability_text}|{rating_class}"
+    return hashlib.sha256(hash_string.encode()).hexdigest()
+
+
 def safe_get_attribute(tag, attribute: str, default=None):
     """
     Safely get attribute from tag, return default if missing or empty
@@ -266,109 +285,203 @@ async def scrape_book_async(client: httpx.AsyncClient, url: str, semaphore: asyn
             logger.error(f"Failed to scrape {url} after all retry attempts: {e}")
             return None
 
-async def scrape_multiple_books(book_urls: List[str], max_concurrent: int = 10) -> List[dict]:
+async def scrape_multiple_books_iter(
+    book_urls: List[str],
+    max_concurrent: int = 10,
+    semaphore: Optional[asyncio.Semaphore] = None,
+    client: Optional[httpx.AsyncClient] = None
+):
     """
-    Scrape multiple books concurrently
-    
+    Scrape multiple books concurrently, yielding each as it completes
+
+    Lets consumers (e.g. DB writers) start draining results while the
+    remaining requests are still in flight, instead of waiting for the
+    whole batch.
+
     Args:
         book_urls: List of book URLs to scrape
         max_concurrent: Maximum number of concurrent requests
-        
-    Returns:
-        List of book data dictionaries (successful scrapes only)
+        semaphore: Optional shared semaphore; lets several callers share
+            one concurrency budget instead of each getting their own
+        client: Optional shared HTTP client; reuses its connection pool
+            and DNS cache instead of handshaking per call
+
+    Yields:
+        Book data dictionaries (successful scrapes only)
     """
-    # Create semaphore to limit concurrent requests
-    semaphore = asyncio.Semaphore(max_concurrent)
-    
-    # Create async HTTP client
-    async with httpx.AsyncClient() as client:
+    # Create semaphore to limit concurrent requests (unless sharing one)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(max_concurrent)
+
+    # Create an HTTP client only if the caller didn't pass a shared one
+    owns_client = client is None
+    if owns_client:
+        client = httpx.AsyncClient()
+
+    try:
         # Create tasks for all books
         tasks = [
-            scrape_book_async(client, url, semaphore)
+            asyncio.ensure_future(scrape_book_async(client, url, semaphore))
             for url in book_urls
         ]
-        
-        # Run all tasks concurrently
-        results = await asyncio.gather(*tasks)
-    
-    # Filter out None values (failed scrapes)
-    successful_results = [book for book in results if book is not None]
-    
-    return successful_results
 
+        try:
+            # Yield results in completion order
+            for future in asyncio.as_completed(tasks):
+                book_data = await future
+                if book_data is not None:
+                    yield book_data
+        finally:
+            # Don't leak in-flight tasks if the consumer stops early
+            for task in tasks:
+                task.cancel()
+    finally:
+        if owns_client:
+            await client.aclose()
 
-async def get_book_urls_from_page_async(client: httpx.AsyncClient, page_url: str) -> List[str]:
+
+async def scrape_multiple_books(
+    book_urls: List[str],
+    max_concurrent: int = 10,
+    semaphore: Optional[asyncio.Semaphore] = None,
+    client: Optional[httpx.AsyncClient] = None
+) -> List[dict]:
     """
-    Extract all book URLs from a catalog page asynchronously
-    
+    Scrape multiple books concurrently
+
+    Args:
+        book_urls: List of book URLs to scrape
+        max_concurrent: Maximum number of concurrent requests
+        semaphore: Optional shared semaphore; lets several callers share
+            one concurrency budget instead of each getting their own
+        client: Optional shared HTTP client; reuses its connection pool
+            and DNS cache instead of handshaking per call
+
+    Returns:
+        List of book data dictionaries (successful scrapes only)
+    """
+    return [
+        book async for book in scrape_multiple_books_iter(book_urls, max_concurrent, semaphore, client)
+    ]
+
+
+async def get_book_listings_from_page_async(client: httpx.AsyncClient, page_url: str) -> List[Tuple[str, str]]:
+    """
+    Extract book URLs and listing hashes from a catalog page asynchronously
+
     Args:
         client: Async HTTP client
         page_url: URL of the catalog page
-        
+
     Returns:
-        List of book URLs
+        List of (book_url, listing_hash) tuples
     """
     html = await fetch_html(client, page_url)
-    
+
     if not html:
         return []
-    
+
     soup = BeautifulSoup(html, 'lxml')
     articles = soup.find_all('article', class_='product_pod')
-    
-    book_urls = []
-    
+
+    listings = []
+
     for article in articles:
         h3_tag = article.find('h3')
         if not h3_tag:
             continue
-        
+
         link_tag = h3_tag.find('a')
         if not link_tag:
             continue
-        
+
         href = safe_get_attribute(link_tag, 'href')
         if not href:
             continue
-        
+
         # Convert relative URL to absolute
         href = href.replace('../', '')
-        
+
         if href.startswith('catalogue/'):
             absolute_url = f"https://books.toscrape.com/{href}"
         else:
             absolute_url = f"https://books.toscrape.com/catalogue/{href}"
-        
-        book_urls.append(absolute_url)
-    
-    return book_urls
 
+        # Hash the change-relevant fields shown on the listing row
+        price_tag = article.find('p', class_='price_color')
+        price_text = price_tag.text.strip() if price_tag else ''
 
-async def get_all_book_urls_async(base_url: str = "https://books.toscrape.com/") -> List[str]:
+        availability_tag = article.find('p', class_='availability')
+        availability_text = availability_tag.text.strip() if availability_tag else ''
+
+        rating_class = ''
+        rating_p = article.find('p', class_='star-rating')
+        if rating_p:
+            classes = rating_p.get('class', [])
+            if len(classes) >= 2:
+                rating_class = classes[1]
+
+        listing_hash = generate_listing_hash(price_text, availability_text, rating_class)
+
+        listings.append((absolute_url, listing_hash))
+
+    return listings
+
+
+async def get_book_urls_from_page_async(client: httpx.AsyncClient, page_url: str) -> List[str]:
     """
-    Get all book URLs from all pages asynchronously
-    
+    Extract all book URLs from a catalog page asynchronously
+
+    Args:
+        client: Async HTTP client
+        page_url: URL of the catalog page
+
+    Returns:
+        List of book URLs
+    """
+    listings = await get_book_listings_from_page_async(client, page_url)
+    return [url for url, _ in listings]
+
+
+async def get_all_book_listings_async(
+    base_url: str = "https://books.toscrape.com/",
+    client: Optional[httpx.AsyncClient] = None
+) -> Dict[str, str]:
+    """
+    Get all book URLs with their listing hashes from all pages asynchronously
+
+    The listing hash covers the price, availability and rating shown on
+    the catalog row; comparing it against the stored value lets callers
+    skip detail-page fetches for books that cannot have changed.
+
     Args:
         base_url: Base URL of the website
-        
+        client: Optional shared HTTP client; reuses its connection pool
+            and DNS cache instead of handshaking per call
+
     Returns:
-        List of all book URLs
+        Dictionary mapping book URL to listing hash
     """
     print(f"\nFetching all book URLs from {base_url}")
-    
-    async with httpx.AsyncClient() as client:
+
+    # Create an HTTP client only if the caller didn't pass a shared one
+    owns_client = client is None
+    if owns_client:
+        client = httpx.AsyncClient()
+
+    try:
         # Get pagination info from homepage
         html = await fetch_html(client, base_url)
-        
+
         if not html:
             print("Failed to fetch homepage")
-            return []
-        
+            return {}
+
         soup = BeautifulSoup(html, 'lxml')
         pagination = soup.find('ul', class_='pager')
-        
+
         total_pages = 1
-        
+
         if pagination:
             current_page_li = pagination.find('li', class_='current')
             if current_page_li:
@@ -380,28 +493,50 @@ async def get_all_book_urls_async(base_url: str = "https://books.toscrape.com/")
                         print(f"Found {total_pages} pages")
                 except (ValueError, IndexError):
                     pass
-        
+
         # Build all page URLs
         page_urls = [base_url]
         for page_num in range(2, total_pages + 1):
             page_url = f"{base_url}catalogue/page-{page_num}.html"
             page_urls.append(page_url)
-        
+
         print(f"Extracting book URLs from {len(page_urls)} pages...")
-        
-        # Fetch book URLs from all pages concurrently
+
+        # Fetch listings from all pages concurrently
         tasks = [
-            get_book_urls_from_page_async(client, page_url)
+            get_book_listings_from_page_async(client, page_url)
             for page_url in page_urls
         ]
-        
+
         results = await asyncio.gather(*tasks)
-        
-        # Flatten list of lists
-        all_book_urls = []
-        for book_urls in results:
-            all_book_urls.extend(book_urls)
-        
-        print(f"Total book URLs extracted: {len(all_book_urls)}")
-        
-        return all_book_urls
\ No newline at end of file
+
+        # Flatten list of lists into one url -> listing_hash mapping
+        all_listings = {}
+        for listings in results:
+            all_listings.update(listings)
+
+        print(f"Total book URLs extracted: {len(all_listings)}")
+
+        return all_listings
+    finally:
+        if owns_client:
+            await client.aclose()
+
+
+async def get_all_book_urls_async(
+    base_url: str = "https://books.toscrape.com/",
+    client: Optional[httpx.AsyncClient] = None
+) -> List[str]:
+    """
+    Get all book URLs from all pages asynchronously
+
+    Args:
+        base_url: Base URL of the website
+        client: Optional shared HTTP client; reuses its connection pool
+            and DNS cache instead of handshaking per call
+
+    Returns:
+        List of all book URLs
+    """
+    listings = await get_all_book_listings_async(base_url, client)
+    return list(listings)
\ No newline at end of file
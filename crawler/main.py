@@ -18,8 +18,8 @@ from config.crawler_config import CrawlerConfig, default_config
 # )
 
 from repositories.book_repository import (
-    save_book_to_db, 
-    create_indexes, 
+    save_books_bulk,
+    create_indexes,
     get_all_crawled_urls,
     get_crawl_statistics)
 
@@ -43,25 +43,14 @@ async def save_books_batch(db, books: List[dict]) -> dict:
     Returns:
         Dictionary with success/failure counts
     """
-    results = {
-        'success': 0,
-        'failed': 0
+    # One bulk_write round-trip for the whole batch instead of an
+    # update_one per book
+    saved = await save_books_bulk(db, books)
+
+    return {
+        'success': len(saved),
+        'failed': len(books) - len(saved)
     }
-    
-    for book in books:
-        try:
-            success = await save_book_to_db(db, book)
-            if success:
-                results['success'] += 1
-                logger.debug(f"Saved: {book.get('name', 'Unknown')}")
-            else:
-                results['failed'] += 1
-                logger.warning(f"Failed to save: {book.get('name', 'Unknown')}")
-        except Exception as e:
-            logger.error(f"Error saving book {book.get('name', 'Unknown')}: {e}")
-            results['failed'] += 1
-    
-    return results
 
 
 def filter_new_books(all_urls: List[str], existing_urls: Set[str]) -> List[str]:
@@ -11,6 +11,7 @@ UTC_PLUS_1 = timezone(timedelta(hours=1))
 class APIKeyModel(BaseModel):
     """Database model for API key"""
     key_hash: str = Field(..., description="SHA256 hash of the API key")
+    key_hash_prefix: Optional[str] = Field(None, max_length=16, description="Indexed prefix of key_hash for fast auth lookups")
     name: str = Field(..., max_length=200, description="Name/description of the key")
     created_at: datetime = Field(default_factory=lambda: datetime.now(UTC_PLUS_1))
     is_active: bool = Field(default=True, description="Whether the key is active")
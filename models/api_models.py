@@ -6,19 +6,24 @@ from typing import Optional, List, Any
 from datetime import datetime
 
 class APIBookResponse(BaseModel):
-    """Response model for book data"""
+    """Response model for book data
+
+    All fields except id are optional so responses validate when the
+    client narrows the payload with ?fields= projections; full documents
+    still populate everything.
+    """
     id: str
-    name: str
+    name: Optional[str] = None
     description: Optional[str] = None
-    category: str
-    price_incl_tax: float
-    price_excl_tax: float
-    availability: str
-    number_of_reviews: int
-    rating: int
+    category: Optional[str] = None
+    price_incl_tax: Optional[float] = None
+    price_excl_tax: Optional[float] = None
+    availability: Optional[str] = None
+    number_of_reviews: Optional[int] = None
+    rating: Optional[int] = None
     image_url: Optional[str] = None
-    source_url: str
-    crawled_at: datetime
+    source_url: Optional[str] = None
+    crawled_at: Optional[datetime] = None
     
     model_config = ConfigDict(
         json_schema_extra = {
@@ -67,6 +72,7 @@ class BookListResponse(BaseModel):
     page: int
     page_size: int
     total_pages: int
+    next_cursor: Optional[str] = None
     data: List[APIBookResponse]
 
 
@@ -37,6 +37,7 @@ class BookModel(BaseModel):
     updated_at: datetime = Field(default_factory=lambda: datetime.now(UTC_PLUS_1))
     status: BookStatus = Field(default=BookStatus.ACTIVE)
     content_hash: str = Field(..., min_length=32, max_length=64)
+    listing_hash: Optional[str] = Field(None, max_length=64)
     raw_html_snapshot: Optional[str] = Field(None)
     
     """Pydantic config"""
@@ -1,3 +1,3 @@
-from .email_notifier import send_email_alert, test_email_configuration, EmailConfig
+from .email_notifier import send_email_alert, send_email_alert_async, test_email_configuration, EmailConfig, get_email_config
 
-__all__ = ['send_email_alert', 'test_email_configuration', 'EmailConfig']
\ No newline at end of file
+__all__ = ['send_email_alert', 'send_email_alert_async', 'test_email_configuration', 'EmailConfig', 'get_email_config']
\ No newline at end of file
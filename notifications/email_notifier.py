@@ -2,8 +2,11 @@
 Email notification sender
 """
 import os
+import asyncio
 import smtplib
 import logging
+import functools
+from dataclasses import dataclass
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from email.mime.base import MIMEBase
@@ -18,32 +21,57 @@ load_dotenv()
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True, slots=True)
 class EmailConfig:
     """Email configuration from environment variables"""
-    SMTP_SERVER = os.getenv('SMTP_SERVER')
-    SMTP_PORT = int(os.getenv('SMTP_PORT'))
-    SMTP_USERNAME = os.getenv('SMTP_USERNAME')
-    SMTP_PASSWORD = os.getenv('SMTP_PASSWORD')
-    ALERT_EMAIL = os.getenv('ALERT_EMAIL')
-    EMAIL_FROM_NAME = os.getenv('EMAIL_FROM_NAME')
+    smtp_server: Optional[str]
+    smtp_port: int
+    smtp_username: Optional[str]
+    smtp_password: Optional[str]
+    alert_email: Optional[str]
+    email_from_name: Optional[str]
 
 
-def build_email_body(summary: SchedulerRunSummary) -> str:
+@functools.cache
+def get_email_config() -> Optional[EmailConfig]:
+    """
+    Load email configuration from environment (cached after first call)
+
+    Returns:
+        EmailConfig instance, or None if SMTP_PORT is not a valid integer
+    """
+    try:
+        return EmailConfig(
+            smtp_server=os.getenv('SMTP_SERVER'),
+            smtp_port=int(os.getenv('SMTP_PORT', '0')),
+            smtp_username=os.getenv('SMTP_USERNAME'),
+            smtp_password=os.getenv('SMTP_PASSWORD'),
+            alert_email=os.getenv('ALERT_EMAIL'),
+            email_from_name=os.getenv('EMAIL_FROM_NAME')
+        )
+    except (TypeError, ValueError) as e:
+        logger.error(f"Invalid email configuration: {e}")
+        return None
+
+
+def build_email_body(summary: SchedulerRunSummary, has_changes: bool) -> str:
     """
     Build HTML email body from summary
-    
+
     Args:
         summary: Scheduler run summary
-        
+        has_changes: Whether the run detected any changes (computed by caller)
+
     Returns:
         HTML email body
     """
-    # Determine if there are significant changes
-    has_changes = summary.new_books_added > 0 or summary.books_updated > 0
-    
     status_color = "green" if has_changes else "gray"
     status_text = "Changes Detected" if has_changes else "No Changes"
-    
+
+    # Extract fields once - the template references them many times and a
+    # dict lookup is cheaper than going through pydantic attribute access
+    d = summary.model_dump()
+
     html = f"""
     <html>
     <head>
@@ -63,49 +91,49 @@ def build_email_body(summary: SchedulerRunSummary) -> str:
     <body>
         <div class="header">
             <h1>Change Detection Report</h1>
-            <p>{summary.started_at.strftime("%B %d, %Y at %H:%M")}</p>
+            <p>{d['started_at'].strftime("%B %d, %Y at %H:%M")}</p>
         </div>
         
         <div class="content">
             <div class="summary-box">
                 <h2 style="color: {status_color}; margin-top: 0;">{status_text}</h2>
-                <p><strong>Run ID:</strong> {summary.run_id}</p>
-                <p><strong>Duration:</strong> {summary.duration_seconds / 60:.2f} minutes</p>
+                <p><strong>Run ID:</strong> {d['run_id']}</p>
+                <p><strong>Duration:</strong> {d['duration_seconds'] / 60:.2f} minutes</p>
             </div>
             
             <h3>Summary Statistics</h3>
             <div class="stats">
                 <div class="stat-row">
                     <div class="stat-label">Total Books on Website:</div>
-                    <div class="stat-value">{summary.total_books_on_site}</div>
+                    <div class="stat-value">{d['total_books_on_site']}</div>
                 </div>
                 <div class="stat-row">
                     <div class="stat-label">Books in Database (Before):</div>
-                    <div class="stat-value">{summary.total_books_in_db_before}</div>
+                    <div class="stat-value">{d['total_books_in_db_before']}</div>
                 </div>
                 <div class="stat-row">
                     <div class="stat-label">Books in Database (After):</div>
-                    <div class="stat-value">{summary.total_books_in_db_after}</div>
+                    <div class="stat-value">{d['total_books_in_db_after']}</div>
                 </div>
                 <div class="stat-row">
                     <div class="stat-label">New Books Added:</div>
-                    <div class="stat-value"><span class="highlight">{summary.new_books_added}</span></div>
+                    <div class="stat-value"><span class="highlight">{d['new_books_added']}</span></div>
                 </div>
                 <div class="stat-row">
                     <div class="stat-label">Books Updated:</div>
-                    <div class="stat-value"><span class="highlight">{summary.books_updated}</span></div>
+                    <div class="stat-value"><span class="highlight">{d['books_updated']}</span></div>
                 </div>
                 <div class="stat-row">
                     <div class="stat-label">Books Unchanged:</div>
-                    <div class="stat-value">{summary.books_unchanged}</div>
+                    <div class="stat-value">{d['books_unchanged']}</div>
                 </div>
                 <div class="stat-row">
                     <div class="stat-label">Errors:</div>
-                    <div class="stat-value">{summary.errors}</div>
+                    <div class="stat-value">{d['errors']}</div>
                 </div>
             </div>
             
-            {_build_field_changes_section(summary.fields_changed)}
+            {_build_field_changes_section(d['fields_changed'])}
             
             <p style="margin-top: 30px;">
                 Detailed reports (JSON and CSV) are attached to this email.
@@ -114,7 +142,7 @@ def build_email_body(summary: SchedulerRunSummary) -> str:
         
         <div class="footer">
             <p>This is an automated message from ECommerce Crawler</p>
-            <p>Run ID: {summary.run_id}</p>
+            <p>Run ID: {d['run_id']}</p>
         </div>
     </body>
     </html>
@@ -123,23 +151,63 @@ def build_email_body(summary: SchedulerRunSummary) -> str:
     return html
 
 
-def _build_field_changes_section(fields_changed: dict) -> str:
-    """Build HTML section for field changes"""
-    if not fields_changed:
-        return ""
-    
-    html = "<h3>Field Changes Breakdown</h3><div class='stats'>"
-    
-    for field, count in fields_changed.items():
-        html += f"""
+# Row template for the field-changes breakdown
+_ROW_TMPL = """
         <div class="stat-row">
-            <div class="stat-label">{field.replace('_', ' ').title()}:</div>
+            <div class="stat-label">{field}:</div>
             <div class="stat-value">{count} changes</div>
         </div>
         """
-    
-    html += "</div>"
-    return html
+
+
+@functools.lru_cache(maxsize=64)
+def _pretty_field_name(field: str) -> str:
+    """Turn a field name like 'price_incl_tax' into 'Price Incl Tax'"""
+    return field.replace('_', ' ').title()
+
+
+def _build_field_changes_section(fields_changed: dict) -> str:
+    """Build HTML section for field changes"""
+    if not fields_changed:
+        return ""
+
+    rows = "".join(
+        _ROW_TMPL.format(field=_pretty_field_name(field), count=count)
+        for field, count in fields_changed.items()
+    )
+
+    return f"<h3>Field Changes Breakdown</h3><div class='stats'>{rows}</div>"
+
+
+def _build_attachment_part(filepath: str) -> Optional[MIMEBase]:
+    """
+    Read and base64-encode a report file as a MIME attachment
+
+    Args:
+        filepath: Path to the report file
+
+    Returns:
+        MIMEBase part, or None if the file does not exist
+    """
+    path = Path(filepath)
+    if not path.exists():
+        return None
+
+    with open(path, 'rb') as f:
+        part = MIMEBase('application', 'octet-stream')
+        part.set_payload(f.read())
+
+    encoders.encode_base64(part)
+    part.add_header(
+        'Content-Disposition',
+        f'attachment; filename={path.name}'
+    )
+    return part
+
+
+# Run IDs whose alert was already sent - guards against duplicate sends
+# (and duplicate attachment re-encoding) when a run is retried
+_SENT_RUNS: set = set()
 
 
 def send_email_alert(
@@ -149,17 +217,24 @@ def send_email_alert(
 ) -> bool:
     """
     Send email alert with change detection summary
-    
+
     Args:
         summary: Scheduler run summary
         report_files: List of report file paths to attach
         force_send: Send email even if no changes detected
-        
+
     Returns:
         True if email sent successfully, False otherwise
     """
+    # Skip everything (HTML build, attachment encoding) if this run's
+    # alert already went out
+    if summary.run_id in _SENT_RUNS:
+        logger.info(f"Email alert for run {summary.run_id} already sent, skipping")
+        return True
+
     # Check if email is configured
-    if not EmailConfig.SMTP_USERNAME or not EmailConfig.ALERT_EMAIL:
+    config = get_email_config()
+    if config is None or not config.smtp_username or not config.alert_email:
         logger.warning("Email not configured, skipping email alert")
         return False
     
@@ -170,38 +245,35 @@ def send_email_alert(
         logger.info("No changes detected, skipping email alert")
         return True
     
+    # Build subject once from the same counts used for has_changes
+    subject = f"Change Detection Report - {summary.new_books_added} New, {summary.books_updated} Updated"
+
     try:
         # Create message
         msg = MIMEMultipart()
-        msg['From'] = f"{EmailConfig.EMAIL_FROM_NAME} <{EmailConfig.SMTP_USERNAME}>"
-        msg['To'] = EmailConfig.ALERT_EMAIL
-        msg['Subject'] = f"Change Detection Report - {summary.new_books_added} New, {summary.books_updated} Updated"
-        
+        msg['From'] = f"{config.email_from_name} <{config.smtp_username}>"
+        msg['To'] = config.alert_email
+        msg['Subject'] = subject
+
         # Add body
-        html_body = build_email_body(summary)
+        html_body = build_email_body(summary, has_changes)
         msg.attach(MIMEText(html_body, 'html'))
         
         # Attach report files
         if report_files:
             for filepath in report_files:
-                if Path(filepath).exists():
-                    with open(filepath, 'rb') as f:
-                        part = MIMEBase('application', 'octet-stream')
-                        part.set_payload(f.read())
-                        encoders.encode_base64(part)
-                        part.add_header(
-                            'Content-Disposition',
-                            f'attachment; filename={Path(filepath).name}'
-                        )
-                        msg.attach(part)
+                part = _build_attachment_part(filepath)
+                if part:
+                    msg.attach(part)
         
         # Send email
-        with smtplib.SMTP(EmailConfig.SMTP_SERVER, EmailConfig.SMTP_PORT) as server:
+        with smtplib.SMTP(config.smtp_server, config.smtp_port) as server:
             server.starttls()
-            server.login(EmailConfig.SMTP_USERNAME, EmailConfig.SMTP_PASSWORD)
+            server.login(config.smtp_username, config.smtp_password)
             server.send_message(msg)
-        
-        logger.info(f"Email alert sent to {EmailConfig.ALERT_EMAIL}")
+
+        _SENT_RUNS.add(summary.run_id)
+        logger.info(f"Email alert sent to {config.alert_email}")
         return True
         
     except Exception as e:
@@ -209,6 +281,28 @@ def send_email_alert(
         return False
 
 
+async def send_email_alert_async(
+    summary: SchedulerRunSummary,
+    report_files: Optional[List[str]] = None,
+    force_send: bool = False
+) -> bool:
+    """
+    Send email alert without blocking the event loop
+
+    Runs send_email_alert (attachment encoding + blocking SMTP I/O) in a
+    worker thread.
+
+    Args:
+        summary: Scheduler run summary
+        report_files: List of report file paths to attach
+        force_send: Send email even if no changes detected
+
+    Returns:
+        True if email sent successfully, False otherwise
+    """
+    return await asyncio.to_thread(send_email_alert, summary, report_files, force_send)
+
+
 def test_email_configuration() -> bool:
     """
     Test email configuration by sending a test email
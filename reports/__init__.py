@@ -1,4 +1,11 @@
-from .json_reporter import generate_json_report, load_json_report
-from .csv_reporter import generate_csv_report
+from .json_reporter import generate_json_report, generate_json_report_async, generate_json_report_streamed, load_json_report
+from .csv_reporter import generate_csv_report, generate_csv_report_async
 
-__all__ = ['generate_json_report', 'load_json_report', 'generate_csv_report']
\ No newline at end of file
+__all__ = [
+    'generate_json_report',
+    'generate_json_report_async',
+    'generate_json_report_streamed',
+    'load_json_report',
+    'generate_csv_report',
+    'generate_csv_report_async',
+]
\ No newline at end of file
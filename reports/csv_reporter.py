@@ -1,6 +1,7 @@
 """
 CSV report generation
 """
+import asyncio
 import csv
 import logging
 from datetime import datetime
@@ -115,4 +116,26 @@ def generate_csv_report(
         
     except Exception as e:
         logger.error(f"Error generating CSV report: {e}")
-        raise
\ No newline at end of file
+        raise
+
+
+async def generate_csv_report_async(
+    summary: SchedulerRunSummary,
+    changelogs: List[dict],
+    output_dir: str = "reports/output"
+) -> str:
+    """
+    Generate CSV report without blocking the event loop
+
+    Runs generate_csv_report in a worker thread so the scheduler can keep
+    awaiting Mongo/SMTP work while the file is written.
+
+    Args:
+        summary: Scheduler run summary
+        changelogs: List of changelog entries
+        output_dir: Directory to save report
+
+    Returns:
+        Path to generated report file
+    """
+    return await asyncio.to_thread(generate_csv_report, summary, changelogs, output_dir)
\ No newline at end of file
@@ -1,11 +1,12 @@
 """
 JSON report generation
 """
+import asyncio
 import json
 import logging
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
-from typing import List
+from typing import AsyncIterator, List
 from models.changelog import SchedulerRunSummary
 
 logger = logging.getLogger(__name__)
@@ -31,56 +32,143 @@ def generate_json_report(
     """
     # Create output directory if it doesn't exist
     Path(output_dir).mkdir(parents=True, exist_ok=True)
-    
-    # Build report structure
-    report = {
-        "summary": {
-            "run_id": summary.run_id,
-            "started_at": summary.started_at.isoformat(),
-            "completed_at": summary.completed_at.isoformat(),
-            "duration_seconds": summary.duration_seconds,
-            "duration_minutes": round(summary.duration_seconds / 60, 2),
-            "total_books_on_site": summary.total_books_on_site,
-            "total_books_in_db_before": summary.total_books_in_db_before,
-            "total_books_in_db_after": summary.total_books_in_db_after,
-            "new_books_added": summary.new_books_added,
-            "books_updated": summary.books_updated,
-            "books_unchanged": summary.books_unchanged,
-            "fields_changed": summary.fields_changed,
-            "errors": summary.errors
-        },
-        "changes": []
-    }
-    
-    # Add all changelogs
-    for changelog in changelogs:
-        change_entry = {
-            "book_source_url": changelog.get("book_source_url"),
-            "book_name": changelog.get("book_name"),
-            "change_type": changelog.get("change_type"),
-            "changes": changelog.get("changes"),
-            "changed_at": changelog.get("changed_at").isoformat() if isinstance(changelog.get("changed_at"), datetime) else str(changelog.get("changed_at"))
-        }
-        report["changes"].append(change_entry)
-    
+
+    summary_dict = _to_summary_dict(summary)
+
     # Generate filename
     timestamp = summary.started_at.strftime("%Y-%m-%d_%H-%M-%S")
     filename = f"change_report_{timestamp}.json"
     filepath = Path(output_dir) / filename
-    
-    # Write to file
+
+    # Stream the report to file: one changelog entry at a time, so the
+    # full "changes" list is never materialized in memory
     try:
         with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(report, f, indent=2, ensure_ascii=False)
-        
+            f.write('{"summary": ')
+            json.dump(summary_dict, f, ensure_ascii=False)
+            f.write(', "changes": [')
+
+            first = True
+            for changelog in changelogs:
+                if not first:
+                    f.write(', ')
+                json.dump(_to_change_entry(changelog), f, ensure_ascii=False)
+                first = False
+
+            f.write(']}')
+
         logger.info(f"JSON report generated: {filepath}")
         return str(filepath)
-        
+
+    except Exception as e:
+        logger.error(f"Error generating JSON report: {e}")
+        raise
+
+
+def _to_summary_dict(summary: SchedulerRunSummary) -> dict:
+    """Shape the run summary into the report's summary section (small, fixed size)"""
+    return {
+        "run_id": summary.run_id,
+        "started_at": summary.started_at.isoformat(),
+        "completed_at": summary.completed_at.isoformat(),
+        "duration_seconds": summary.duration_seconds,
+        "duration_minutes": round(summary.duration_seconds / 60, 2),
+        "total_books_on_site": summary.total_books_on_site,
+        "total_books_in_db_before": summary.total_books_in_db_before,
+        "total_books_in_db_after": summary.total_books_in_db_after,
+        "new_books_added": summary.new_books_added,
+        "books_updated": summary.books_updated,
+        "books_unchanged": summary.books_unchanged,
+        "fields_changed": summary.fields_changed,
+        "errors": summary.errors
+    }
+
+
+def _to_change_entry(changelog: dict) -> dict:
+    """Shape a changelog document into a JSON-serializable report entry"""
+    changed_at = changelog.get("changed_at")
+
+    return {
+        "book_source_url": changelog.get("book_source_url"),
+        "book_name": changelog.get("book_name"),
+        "change_type": changelog.get("change_type"),
+        "changes": changelog.get("changes"),
+        "changed_at": changed_at.isoformat() if isinstance(changed_at, datetime) else str(changed_at)
+    }
+
+
+async def generate_json_report_streamed(
+    summary: SchedulerRunSummary,
+    changelogs: AsyncIterator[dict],
+    output_dir: str = "reports/output"
+) -> str:
+    """
+    Generate JSON report directly from an async changelog cursor
+
+    Consumes documents as the database yields them - pair with
+    iter_changelogs_by_run_id or iter_changelogs_by_date_range and the
+    run's change list is never materialized, so memory stays flat
+    however many changes a run produces.
+
+    Args:
+        summary: Scheduler run summary
+        changelogs: Async iterable of changelog documents
+        output_dir: Directory to save report
+
+    Returns:
+        Path to generated report file
+    """
+    Path(output_dir).mkdir(parents=True, exist_ok=True)
+
+    timestamp = summary.started_at.strftime("%Y-%m-%d_%H-%M-%S")
+    filename = f"change_report_{timestamp}.json"
+    filepath = Path(output_dir) / filename
+
+    try:
+        with open(filepath, 'w', encoding='utf-8') as f:
+            f.write('{"summary": ')
+            json.dump(_to_summary_dict(summary), f, ensure_ascii=False)
+            f.write(', "changes": [')
+
+            first = True
+            async for changelog in changelogs:
+                if not first:
+                    f.write(', ')
+                json.dump(_to_change_entry(changelog), f, ensure_ascii=False)
+                first = False
+
+            f.write(']}')
+
+        logger.info(f"JSON report generated: {filepath}")
+        return str(filepath)
+
     except Exception as e:
         logger.error(f"Error generating JSON report: {e}")
         raise
 
 
+async def generate_json_report_async(
+    summary: SchedulerRunSummary,
+    changelogs: List[dict],
+    output_dir: str = "reports/output"
+) -> str:
+    """
+    Generate JSON report without blocking the event loop
+
+    Runs generate_json_report in a worker thread so the scheduler can keep
+    awaiting Mongo/SMTP work while the file is written.
+
+    Args:
+        summary: Scheduler run summary
+        changelogs: List of changelog entries
+        output_dir: Directory to save report
+
+    Returns:
+        Path to generated report file
+    """
+    return await asyncio.to_thread(generate_json_report, summary, changelogs, output_dir)
+
+
 def load_json_report(filepath: str) -> dict:
     """
     Load a JSON report from file
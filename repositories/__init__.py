@@ -1,6 +1,8 @@
 from .book_repository import (
     save_book_to_db,
+    save_books_bulk,
     get_book_by_url,
+    get_books_by_urls,
     get_all_crawled_urls,
     get_crawl_statistics,
     create_indexes,
@@ -10,10 +12,13 @@ from .book_repository import (
 
 from .changelog_repository import (
     save_changelog,
+    save_changelogs_bulk,
     get_changelogs_by_run_id,
+    iter_changelogs_by_run_id,
     get_recent_changelogs,
     get_changelogs_by_change_type,
     get_changelogs_by_date_range,
+    iter_changelogs_by_date_range,
     count_changelogs_by_run_id,
     get_field_change_statistics,
     create_changelog_indexes,
@@ -23,7 +28,8 @@ from .api_key_repository import (
     save_api_key, 
     get_api_key_by_hash, 
     get_all_api_keys,
-    deactivate_api_key, 
+    deactivate_api_key,
+    deactivate_api_keys,
     create_api_key_indexes
 )
 
@@ -31,15 +37,20 @@ from .api_key_repository import (
 
 __all__ = [
     'save_book_to_db',
+    'save_books_bulk',
     'get_book_by_url',
+    'get_books_by_urls',
     'get_all_crawled_urls',
     'get_crawl_statistics',
     'create_indexes',
     'save_changelog',
+    'save_changelogs_bulk',
     'get_changelogs_by_run_id',
+    'iter_changelogs_by_run_id',
     'get_recent_changelogs',
     'get_changelogs_by_change_type',
     'get_changelogs_by_date_range',
+    'iter_changelogs_by_date_range',
     'count_changelogs_by_run_id',
     'get_field_change_statistics',
     'create_changelog_indexes',
@@ -49,6 +60,7 @@ __all__ = [
     'get_api_key_by_hash',
     'get_all_api_keys',
     'deactivate_api_key',
+    'deactivate_api_keys',
     'create_api_key_indexes'
 
 ]
@@ -2,12 +2,18 @@
 API Key repository - database operations
 """
 from motor.motor_asyncio import AsyncIOMotorDatabase
-from typing import Optional, List
+from typing import Optional, List, Union
+import hmac
 import logging
 from bson import ObjectId
 
 logger = logging.getLogger(__name__)
 
+# Hex chars of key_hash stored in the indexed key_hash_prefix field
+# (16 hex chars = 8 bytes): the auth lookup becomes a point query on a
+# small prefix index instead of the full 64-char hash index
+KEY_HASH_PREFIX_LEN = 16
+
 
 async def save_api_key(db: AsyncIOMotorDatabase, api_key_data: dict) -> bool:
     """
@@ -41,7 +47,25 @@ async def get_api_key_by_hash(db: AsyncIOMotorDatabase, key_hash: str) -> Option
         API key document or None
     """
     try:
-        api_key = await db.api_keys.find_one({'key_hash': key_hash, 'is_active': True})
+        # Auth hot path: point lookup on the small prefix index, then
+        # constant-time verification of the full hash. Project only what
+        # validation needs so we don't ship/decode the full document
+        projection = {'_id': 1, 'key_hash': 1, 'name': 1, 'is_active': 1}
+        prefix = key_hash[:KEY_HASH_PREFIX_LEN]
+
+        cursor = db.api_keys.find(
+            {'key_hash_prefix': prefix, 'is_active': True},
+            projection
+        )
+        async for api_key in cursor:
+            if hmac.compare_digest(api_key.get('key_hash', ''), key_hash):
+                return api_key
+
+        # Keys created before key_hash_prefix existed - full-hash lookup
+        api_key = await db.api_keys.find_one(
+            {'key_hash': key_hash, 'is_active': True, 'key_hash_prefix': {'$exists': False}},
+            projection
+        )
         return api_key
     except Exception as e:
         logger.error(f"Error getting API key: {e}")
@@ -59,7 +83,7 @@ async def get_all_api_keys(db: AsyncIOMotorDatabase) -> List[dict]:
         List of API key documents
     """
     try:
-        cursor = db.api_keys.find()
+        cursor = db.api_keys.find().batch_size(1000)
         api_keys = await cursor.to_list(length=None)
         
         # Convert _id to string
@@ -72,32 +96,52 @@ async def get_all_api_keys(db: AsyncIOMotorDatabase) -> List[dict]:
         return []
 
 
-async def deactivate_api_key(db: AsyncIOMotorDatabase, key_id: str) -> bool:
+async def deactivate_api_keys(db: AsyncIOMotorDatabase, key_ids: List[Union[str, ObjectId]]) -> int:
     """
-    Deactivate an API key by ID
-    
+    Deactivate multiple API keys in a single update_many call
+
     Args:
         db: Database connection
-        key_id: MongoDB ObjectId as string
-        
+        key_ids: MongoDB ObjectIds, as strings or pre-parsed ObjectId instances
+
     Returns:
-        True if successful
+        Number of keys deactivated
     """
+    if not key_ids:
+        return 0
+
     try:
-        object_id = ObjectId(key_id)
-        result = await db.api_keys.update_one(
-            {'_id': object_id},
+        object_ids = [
+            key_id if isinstance(key_id, ObjectId) else ObjectId(key_id)
+            for key_id in key_ids
+        ]
+
+        result = await db.api_keys.update_many(
+            {'_id': {'$in': object_ids}},
             {'$set': {'is_active': False}}
         )
-        
+
         if result.modified_count > 0:
-            logger.info(f"Deactivated API key: {key_id}")
-            return True
-        
-        return False
+            logger.info(f"Deactivated {result.modified_count} API keys")
+
+        return result.modified_count
     except Exception as e:
-        logger.error(f"Error deactivating API key: {e}")
-        return False
+        logger.error(f"Error deactivating API keys: {e}")
+        return 0
+
+
+async def deactivate_api_key(db: AsyncIOMotorDatabase, key_id: Union[str, ObjectId]) -> bool:
+    """
+    Deactivate an API key by ID
+
+    Args:
+        db: Database connection
+        key_id: MongoDB ObjectId as string or pre-parsed ObjectId
+
+    Returns:
+        True if successful
+    """
+    return await deactivate_api_keys(db, [key_id]) > 0
 
 
 async def create_api_key_indexes(db: AsyncIOMotorDatabase):
@@ -109,6 +153,7 @@ async def create_api_key_indexes(db: AsyncIOMotorDatabase):
     """
     try:
         await db.api_keys.create_index('key_hash', unique=True)
+        await db.api_keys.create_index('key_hash_prefix')
         await db.api_keys.create_index('is_active')
         logger.info("Created API key indexes")
     except Exception as e:
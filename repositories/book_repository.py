@@ -2,6 +2,8 @@
 Database helper functions for book operations
 """
 from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import IndexModel, UpdateOne, WriteConcern
+from pymongo.errors import BulkWriteError, OperationFailure
 from models.book import BookModel
 from typing import Optional, List, Set
 import logging
@@ -20,32 +22,75 @@ async def save_book_to_db(db: AsyncIOMotorDatabase, book_data: dict) -> bool:
     Returns:
         True if successful, False otherwise
     """
-    try:
-        # Validate data with Pydantic model
-        book = BookModel(**book_data)
-        
-        # Convert to dict for MongoDB
-        book_dict = book.model_dump()
-        
-        # Upsert: Update if exists, insert if new
-        result = await db.books.update_one(
-            {'source_url': book_dict['source_url']},
-            {'$set': book_dict},
-            upsert=True
-        )
-        
-        if result.upserted_id:
-            logger.info(f"Inserted new book: {book_dict['name']}")
-        elif result.modified_count > 0:
-            logger.info(f"Updated existing book: {book_dict['name']}")
-        else:
-            logger.debug(f"No changes for book: {book_dict['name']}")
-        
-        return True
-        
-    except Exception as e:
-        logger.error(f"Error saving book to database: {e}")
-        return False
+    # Thin wrapper over the bulk path so every caller shares one upsert
+    # implementation; batch callers should use save_books_bulk directly
+    saved = await save_books_bulk(db, [book_data])
+    return len(saved) == 1
+
+
+async def save_books_bulk(db: AsyncIOMotorDatabase, books_data: List[dict], chunk_size: int = 500) -> List[dict]:
+    """
+    Save multiple books with upserts batched into bulk_write calls
+
+    One wire round-trip per chunk instead of one update_one per book.
+
+    Args:
+        db: MongoDB database instance
+        books_data: List of book data dictionaries
+        chunk_size: Maximum operations per bulk_write request
+
+    Returns:
+        List of book dicts whose writes were acknowledged
+    """
+    if not books_data:
+        return []
+
+    # Validate with Pydantic before building ops
+    validated_books = []
+    ops = []
+    for book_data in books_data:
+        try:
+            book_dict = BookModel(**book_data).model_dump()
+            ops.append(UpdateOne(
+                {'source_url': book_dict['source_url']},
+                {'$set': book_dict},
+                upsert=True
+            ))
+            validated_books.append(book_dict)
+        except Exception as e:
+            logger.error(f"Invalid book data for {book_data.get('source_url', 'unknown')}: {e}")
+
+    # Upserts are re-run every cycle, so single-node acknowledgment (w=1)
+    # is enough - no need to wait for majority replication
+    books_w1 = db.get_collection('books', write_concern=WriteConcern(w=1))
+
+    # Flush in chunks to cap request size; only books whose write was
+    # acknowledged count as saved, so callers' success totals are real
+    saved_books = []
+    for i in range(0, len(ops), chunk_size):
+        chunk = ops[i:i + chunk_size]
+        chunk_books = validated_books[i:i + chunk_size]
+        try:
+            result = await books_w1.bulk_write(chunk, ordered=False)
+            saved_books.extend(chunk_books)
+            logger.info(
+                f"Bulk book write: {result.upserted_count} inserted, "
+                f"{result.modified_count} updated ({len(chunk)} ops)"
+            )
+        except BulkWriteError as e:
+            # ordered=False attempts every op - keep the ones that got
+            # through, drop the indexes listed in writeErrors
+            write_errors = e.details.get('writeErrors', [])
+            failed_indexes = {error['index'] for error in write_errors}
+            saved_books.extend(
+                book for j, book in enumerate(chunk_books)
+                if j not in failed_indexes
+            )
+            logger.error(f"Bulk book write partially failed: {write_errors[:3]}")
+        except Exception as e:
+            logger.error(f"Error bulk saving books to database: {e}")
+
+    return saved_books
 
 
 async def get_book_by_url(db: AsyncIOMotorDatabase, source_url: str) -> Optional[dict]:
@@ -67,6 +112,37 @@ async def get_book_by_url(db: AsyncIOMotorDatabase, source_url: str) -> Optional
         return None
 
 
+async def get_books_by_urls(
+    db: AsyncIOMotorDatabase,
+    source_urls: List[str],
+    projection: Optional[dict] = None
+) -> dict:
+    """
+    Fetch multiple books by source URL with a single $in query
+
+    Args:
+        db: MongoDB database instance
+        source_urls: Book source URLs to fetch
+        projection: Optional Mongo projection (must include source_url)
+
+    Returns:
+        Dictionary mapping source_url to book document
+    """
+    if not source_urls:
+        return {}
+
+    try:
+        cursor = db.books.find({'source_url': {'$in': list(source_urls)}}, projection)
+        books = {doc['source_url']: doc async for doc in cursor}
+
+        logger.info(f"Fetched {len(books)} of {len(source_urls)} requested books")
+        return books
+
+    except Exception as e:
+        logger.error(f"Error fetching books by URLs: {e}")
+        return {}
+
+
 async def get_all_crawled_urls(db: AsyncIOMotorDatabase) -> Set[str]:
     """
     Get set of all source URLs already in database 
@@ -78,15 +154,18 @@ async def get_all_crawled_urls(db: AsyncIOMotorDatabase) -> Set[str]:
         Set of source URLs (set allows O(1) lookup)
     """
     try:
-        # Only fetch the source_url field 
-        cursor = db.books.find({}, {'source_url': 1, '_id': 0})
-        
-        # Use set for O(1) lookup performance
-        urls = {doc['source_url'] async for doc in cursor}
-        
+        # distinct returns one deduplicated array off the source_url index
+        # instead of streaming every document through a cursor
+        try:
+            urls = set(await db.books.distinct('source_url'))
+        except OperationFailure:
+            # distinct replies are capped at 16 MB - fall back to the cursor
+            cursor = db.books.find({}, {'source_url': 1, '_id': 0}).batch_size(5000)
+            urls = {doc['source_url'] async for doc in cursor}
+
         logger.info(f"Found {len(urls)} books already in database")
         return urls
-        
+
     except Exception as e:
         logger.error(f"Error getting crawled URLs: {e}")
         return set()
@@ -103,28 +182,34 @@ async def get_crawl_statistics(db: AsyncIOMotorDatabase) -> dict:
         Dictionary with statistics
     """
     try:
-        total_books = await db.books.count_documents({})
-        
-        # Get category distribution
+        # One $facet pipeline replaces three separate round-trips
+        # (count_documents, category aggregate, latest find_one)
         pipeline = [
-            {'$group': {'_id': '$category', 'count': {'$sum': 1}}},
-            {'$sort': {'count': -1}},
-            {'$limit': 10}
+            {'$facet': {
+                'total': [{'$count': 'n'}],
+                'top_categories': [
+                    {'$group': {'_id': '$category', 'count': {'$sum': 1}}},
+                    {'$sort': {'count': -1}},
+                    {'$limit': 10}
+                ],
+                'latest': [
+                    {'$sort': {'crawled_at': -1}},
+                    {'$limit': 1},
+                    {'$project': {'crawled_at': 1, '_id': 0}}
+                ]
+            }}
         ]
-        top_categories = await db.books.aggregate(pipeline).to_list(length=10)
-        
-        # Get latest crawl time
-        latest = await db.books.find_one(
-            {},
-            sort=[('crawled_at', -1)]
-        )
-        
+        result = (await db.books.aggregate(pipeline).to_list(length=1))[0]
+
+        total = result['total']
+        latest = result['latest']
+
         return {
-            'total_books': total_books,
-            'top_categories': top_categories,
-            'latest_crawl': latest['crawled_at'] if latest else None
+            'total_books': total[0]['n'] if total else 0,
+            'top_categories': result['top_categories'],
+            'latest_crawl': latest[0]['crawled_at'] if latest else None
         }
-        
+
     except Exception as e:
         logger.error(f"Error getting statistics: {e}")
         return {}
@@ -138,21 +223,28 @@ async def create_indexes(db: AsyncIOMotorDatabase):
         db: MongoDB database instance
     """
     try:
-        # Unique index on source_url (prevents duplicates)
-        await db.books.create_index('source_url', unique=True)
-        logger.info("Created unique index on source_url")
-        
-        # Indexes for common queries
-        await db.books.create_index('category')
-        await db.books.create_index('price_incl_tax')
-        await db.books.create_index('rating')
-        await db.books.create_index([('crawled_at', -1)])
-        
-        # Compound index for filtering
-        await db.books.create_index([('category', 1), ('price_incl_tax', 1)])
-        
+        # One createIndexes command instead of a round trip per index
+        await db.books.create_indexes([
+            # Unique index on source_url (prevents duplicates)
+            IndexModel('source_url', unique=True),
+            # Covers the change-detection lookup: source_url -> content_hash
+            # without fetching the document (uniqueness stays on the
+            # single-field index above)
+            IndexModel([('source_url', 1), ('content_hash', 1)]),
+            # Indexes for common queries (category is collated so the API's
+            # case-insensitive equality filter stays an index scan; named
+            # explicitly so it can't collide with a plain category_1 index
+            # left over from databases created before the collation change)
+            IndexModel('category', name='category_ci', collation={'locale': 'en', 'strength': 2}),
+            IndexModel('price_incl_tax'),
+            IndexModel('rating'),
+            IndexModel([('crawled_at', -1)]),
+            # Compound index for filtering
+            IndexModel([('category', 1), ('price_incl_tax', 1)]),
+        ])
+
         logger.info("Created all database indexes")
-        
+
     except Exception as e:
         logger.error(f"Error creating indexes: {e}")
 
@@ -168,7 +260,8 @@ async def get_all_book_urls(db: AsyncIOMotorDatabase) -> Set[str]:
         Set of source URLs
     """
     try:
-        cursor = db.books.find({}, {'source_url': 1, '_id': 0})
+        # Tiny projected documents - large batches cut the round-trip count
+        cursor = db.books.find({}, {'source_url': 1, '_id': 0}).batch_size(5000)
         urls = {doc['source_url'] async for doc in cursor}
         logger.info(f"Found {len(urls)} books in database")
         return urls
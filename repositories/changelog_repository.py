@@ -2,8 +2,10 @@
 ChangeLog repository - handles all changelog database operations
 """
 from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import WriteConcern
+from pymongo.errors import BulkWriteError
 from models.changelog import ChangeLog, ChangeLogCreate
-from typing import List, Optional
+from typing import AsyncGenerator, List, Optional
 from datetime import datetime, timezone, timedelta
 import logging
 
@@ -37,21 +39,81 @@ async def save_changelog(db: AsyncIOMotorDatabase, changelog_data: dict) -> bool
         return False
 
 
+async def save_changelogs_bulk(db: AsyncIOMotorDatabase, changelog_dicts: List[dict]) -> int:
+    """
+    Save multiple changelog entries with a single insert_many call
+
+    One wire round-trip for the whole batch instead of one per entry.
+
+    Args:
+        db: MongoDB database instance
+        changelog_dicts: List of ChangeLog data dictionaries
+
+    Returns:
+        Number of changelogs inserted
+    """
+    if not changelog_dicts:
+        return 0
+
+    try:
+        docs = [ChangeLog(**changelog_data).model_dump() for changelog_data in changelog_dicts]
+
+        # Audit-style entries don't need majority acknowledgment; w=1
+        # halves write latency on a replica set
+        changelogs_w1 = db.get_collection('changelogs', write_concern=WriteConcern(w=1))
+        result = await changelogs_w1.insert_many(docs, ordered=False)
+        inserted = len(result.inserted_ids)
+
+        logger.info(f"Inserted {inserted} changelogs in bulk")
+        return inserted
+
+    except BulkWriteError as e:
+        inserted = e.details.get('nInserted', 0)
+        logger.error(f"Bulk changelog insert partially failed: {inserted}/{len(changelog_dicts)} inserted")
+        return inserted
+    except Exception as e:
+        logger.error(f"Error bulk saving changelogs to database: {e}")
+        return 0
+
+
+async def iter_changelogs_by_run_id(
+    db: AsyncIOMotorDatabase,
+    run_id: str
+) -> AsyncGenerator[dict, None]:
+    """
+    Stream changelogs for a scheduler run, one document at a time
+
+    Feeds the streaming report writers without materializing the run's
+    full change list.
+
+    Args:
+        db: MongoDB database instance
+        run_id: Scheduler run ID
+
+    Yields:
+        Changelog documents, sorted by changed_at descending
+    """
+    # Sorting on changed_at keeps the query on the compound
+    # (detection_run_id, changed_at) index
+    cursor = db.changelogs.find({'detection_run_id': run_id}).sort('changed_at', -1).batch_size(1000)
+
+    async for doc in cursor:
+        yield doc
+
+
 async def get_changelogs_by_run_id(db: AsyncIOMotorDatabase, run_id: str) -> List[dict]:
     """
     Get all changelogs for a specific scheduler run
-    
+
     Args:
         db: MongoDB database instance
         run_id: Scheduler run ID
-        
+
     Returns:
         List of changelog documents
     """
     try:
-        cursor = db.changelogs.find({'detection_run_id': run_id})
-        changelogs = await cursor.to_list(length=None)
-        return changelogs
+        return [doc async for doc in iter_changelogs_by_run_id(db, run_id)]
     except Exception as e:
         logger.error(f"Error getting changelogs for run {run_id}: {e}")
         return []
@@ -98,6 +160,36 @@ async def get_changelogs_by_change_type(db: AsyncIOMotorDatabase, change_type: s
         return []
 
 
+async def iter_changelogs_by_date_range(
+    db: AsyncIOMotorDatabase,
+    start_date: datetime,
+    end_date: datetime
+) -> AsyncGenerator[dict, None]:
+    """
+    Stream changelogs within a date range, one document at a time
+
+    Unlike get_changelogs_by_date_range, this never materializes the full
+    result set, so memory stays flat however wide the range is.
+
+    Args:
+        db: MongoDB database instance
+        start_date: Start datetime (inclusive)
+        end_date: End datetime (inclusive)
+
+    Yields:
+        Changelog documents, sorted by changed_at descending
+    """
+    cursor = db.changelogs.find({
+        'changed_at': {
+            '$gte': start_date,
+            '$lte': end_date
+        }
+    }).sort('changed_at', -1).batch_size(1000)
+
+    async for doc in cursor:
+        yield doc
+
+
 async def get_changelogs_by_date_range(
     db: AsyncIOMotorDatabase,
     start_date: datetime,
@@ -105,25 +197,17 @@ async def get_changelogs_by_date_range(
 ) -> List[dict]:
     """
     Get changelogs within a date range
-    
+
     Args:
         db: MongoDB database instance
         start_date: Start datetime (inclusive)
         end_date: End datetime (inclusive)
-        
+
     Returns:
         List of changelog documents
     """
     try:
-        cursor = db.changelogs.find({
-            'changed_at': {
-                '$gte': start_date,
-                '$lte': end_date
-            }
-        }).sort('changed_at', -1)
-        
-        changelogs = await cursor.to_list(length=None)
-        return changelogs
+        return [doc async for doc in iter_changelogs_by_date_range(db, start_date, end_date)]
     except Exception as e:
         logger.error(f"Error getting changelogs by date range: {e}")
         return []
@@ -141,16 +225,23 @@ async def count_changelogs_by_run_id(db: AsyncIOMotorDatabase, run_id: str) -> d
         Dictionary with counts: {"added": 5, "updated": 3}
     """
     try:
+        # $facet shapes the counts server-side - one ready-to-use document,
+        # no per-group post-processing in Python
         pipeline = [
             {'$match': {'detection_run_id': run_id}},
-            {'$group': {'_id': '$change_type', 'count': {'$sum': 1}}}
+            {'$facet': {
+                'added': [{'$match': {'change_type': 'added'}}, {'$count': 'n'}],
+                'updated': [{'$match': {'change_type': 'updated'}}, {'$count': 'n'}]
+            }}
         ]
-        
-        results = await db.changelogs.aggregate(pipeline).to_list(length=10)
-        
-        counts = {result['_id']: result['count'] for result in results}
-        return counts
-        
+
+        [doc] = await db.changelogs.aggregate(pipeline).to_list(length=1)
+
+        return {
+            'added': doc['added'][0]['n'] if doc['added'] else 0,
+            'updated': doc['updated'][0]['n'] if doc['updated'] else 0
+        }
+
     except Exception as e:
         logger.error(f"Error counting changelogs for run {run_id}: {e}")
         return {}
@@ -198,6 +289,8 @@ async def create_changelog_indexes(db: AsyncIOMotorDatabase):
         # await db.changelogs.create_index('book_id')
         await db.changelogs.create_index('book_source_url')
         await db.changelogs.create_index([('detection_run_id', 1), ('change_type', 1)])
+        # Serves the end-of-run report query: filter by run, newest first
+        await db.changelogs.create_index([('detection_run_id', 1), ('changed_at', -1)])
         
         logger.info("Created changelog indexes")
     except Exception as e:
@@ -1,26 +1,33 @@
 """
 Change detection logic - compares old and new book data
 """
+import logging
+import sys
+from collections import Counter
 from typing import Optional, Tuple, List
+from operator import itemgetter
 from models.book import BookModel
 from models.changelog import FieldChange, ChangeType
 from datetime import datetime, timezone, timedelta
-import logging
 
 logger = logging.getLogger(__name__)
 
 UTC_PLUS_1 = timezone(timedelta(hours=1))
 
 
-# Fields to monitor for changes
-MONITORED_FIELDS = [
+# Fields to monitor for changes - interned tuple, these strings are used
+# as dict keys on every per-book comparison
+MONITORED_FIELDS = tuple(sys.intern(field) for field in (
     'name',
     'price_incl_tax',
     'price_excl_tax',
     'availability',
     'rating',
     'number_of_reviews'
-]
+))
+
+# Extracts all monitored fields as one tuple in a single C-level call
+_GET_MONITORED = itemgetter(*MONITORED_FIELDS)
 
 
 def detect_changes(old_book: dict, new_book_data: dict) -> Optional[dict]:
@@ -34,30 +41,46 @@ def detect_changes(old_book: dict, new_book_data: dict) -> Optional[dict]:
     Returns:
         Dictionary of changes {field_name: FieldChange}, or None if no changes
     """
-    changes = {}
-    
-    for field in MONITORED_FIELDS:
-        old_value = old_book.get(field)
-        new_value = new_book_data.get(field)
-        
-        # Compare values
-        if old_value != new_value:
-            
-            changes[field] = {
-                'old': old_value,
-                'new': new_value
-            }
-            
-            logger.debug(f"Change detected in '{field}': {old_value} -> {new_value}")
-    
-    # Return changes dict or None if no changes
-    return changes if changes else None
+    # Fast path: identical content hashes mean no monitored field changed,
+    # so skip the per-field walk entirely
+    old_hash = old_book.get('content_hash')
+    if old_hash and old_hash == new_book_data.get('content_hash'):
+        return None
+
+    # Gate on a single tuple build + tuple compare; fall back to .get
+    # tuples when a document is missing monitored fields
+    try:
+        old_values = _GET_MONITORED(old_book)
+        new_values = _GET_MONITORED(new_book_data)
+    except KeyError:
+        old_values = tuple(old_book.get(field) for field in MONITORED_FIELDS)
+        new_values = tuple(new_book_data.get(field) for field in MONITORED_FIELDS)
+
+    if old_values == new_values:
+        return None
+
+    # Tuples differ - build the per-field diff
+    changes = {
+        field: {'old': old_value, 'new': new_value}
+        for field, old_value, new_value in zip(MONITORED_FIELDS, old_values, new_values)
+        if old_value != new_value
+    }
+
+    # Don't pay for the join/format unless debug logging is actually on
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Changes detected in: %s", ', '.join(changes))
+
+    return changes or None
 
 
 def compare_content_hashes(old_book: dict, new_book_data: dict) -> bool:
     """
     Quick check: compare content hashes to see if anything changed
-    
+
+    Hot paths (detect_changes and the runner's existing-books loop)
+    inline this comparison to avoid the per-book call overhead; this
+    helper remains for external callers.
+
     Args:
         old_book: Book document from database
         new_book_data: Newly scraped book data
@@ -76,18 +99,21 @@ def build_changelog_entry(
     book_name: str,
     change_type: ChangeType,
     changes: Optional[dict],
-    detection_run_id: str
+    detection_run_id: str,
+    changed_at: Optional[datetime] = None
 ) -> dict:
     """
     Build a changelog entry dictionary ready for database insertion
-    
+
     Args:
         book_source_url: Book source URL
         book_name: Book name
         change_type: "added" or "updated"
         changes: Dictionary of field changes, or None for new books
         detection_run_id: Unique ID for this scheduler run
-        
+        changed_at: Detection timestamp; pass the run's timestamp to avoid
+            a clock read per book (defaults to now)
+
     Returns:
         Changelog entry dictionary
     """
@@ -96,10 +122,10 @@ def build_changelog_entry(
         'book_name': book_name,
         'change_type': change_type.value if isinstance(change_type, ChangeType) else change_type,
         'changes': changes,
-        'changed_at': datetime.now(UTC_PLUS_1),
+        'changed_at': changed_at if changed_at is not None else datetime.now(UTC_PLUS_1),
         'detection_run_id': detection_run_id
     }
-    
+
     return changelog_entry
 
 
@@ -117,15 +143,11 @@ def categorize_books(
     Returns:
         Tuple of (new_book_urls, existing_book_urls)
     """
-    new_books = []
-    existing_books = []
-    
-    for url in site_urls:
-        if url in db_urls:
-            existing_books.append(url)
-        else:
-            new_books.append(url)
-    
+    # Set algebra does the partitioning in one C-level pass each
+    site_set = set(site_urls)
+    new_books = list(site_set - db_urls)
+    existing_books = list(site_set & db_urls)
+
     logger.info(f"Categorized books: {len(new_books)} new, {len(existing_books)} existing")
     
     return new_books, existing_books
@@ -141,14 +163,16 @@ def calculate_field_statistics(changelogs: List[dict]) -> dict:
     Returns:
         Dictionary with field change counts
     """
-    field_stats = {}
-    
+    field_stats = Counter()
+
     for changelog in changelogs:
-        if changelog.get('changes'):
-            for field_name in changelog['changes'].keys():
-                field_stats[field_name] = field_stats.get(field_name, 0) + 1
-    
-    return field_stats
+        changes = changelog.get('changes')
+        if changes:
+            # Keys only - updating with the mapping itself would merge
+            # the FieldChange dicts as counts
+            field_stats.update(changes.keys())
+
+    return dict(field_stats)
 
 
 def generate_run_id() -> str:
@@ -156,8 +180,10 @@ def generate_run_id() -> str:
     Generate a unique ID for this scheduler run
     
     Returns:
-        Run ID string like "run_2025-11-08_14:30:00"
+        Run ID string like "run_2025-11-08_14-30-00"
     """
+    # isoformat + str.replace beats the strftime format parser, and dashes
+    # instead of colons keep the id usable in filenames on Windows
     now = datetime.now(UTC_PLUS_1)
-    run_id = f"run_{now.strftime('%Y-%m-%d_%H:%M:%S')}"
-    return run_id
\ No newline at end of file
+    stamp = now.isoformat(timespec='seconds')[:19]
+    return 'run_' + stamp.replace(':', '-').replace('T', '_')
\ No newline at end of file
@@ -3,6 +3,7 @@ APScheduler setup - runs change detection daily
 """
 import asyncio
 import logging
+import signal
 from datetime import datetime
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
@@ -16,16 +17,32 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Built once at import - the env-backed settings don't change between
+# scheduled triggers
+_CONFIG = CrawlerConfig()
+
+
+def reload_config() -> CrawlerConfig:
+    """
+    Rebuild the cached crawler config from the environment
+
+    Returns:
+        The freshly built CrawlerConfig
+    """
+    global _CONFIG
+    _CONFIG = CrawlerConfig()
+    logger.info("Crawler config reloaded")
+    return _CONFIG
+
 
 async def scheduled_change_detection():
     """
     Wrapper function for scheduled runs
     """
     logger.info("Scheduled change detection triggered")
-    
+
     try:
-        config = CrawlerConfig()
-        summary = await run_change_detection(config)
+        summary = await run_change_detection(_CONFIG)
         
         logger.info("Scheduled change detection completed successfully")
         return summary
@@ -72,13 +89,24 @@ async def main():
     
     logger.info("Scheduler is running. Press Ctrl+C to exit.")
     logger.info("Next run scheduled for: 02:00 AM daily")
-    
+
+    # Block on an Event instead of a wake-every-60s sleep loop so the
+    # event loop idles completely between scheduled runs
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+
+    try:
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, stop_event.set)
+    except NotImplementedError:
+        # Signal handlers aren't available on Windows event loops
+        pass
+
     try:
-        # Keep the program running
-        while True:
-            await asyncio.sleep(60)
-            
+        await stop_event.wait()
     except (KeyboardInterrupt, SystemExit):
+        pass
+    finally:
         logger.info("Shutting down scheduler...")
         scheduler.shutdown()
         logger.info("Scheduler stopped")
@@ -3,19 +3,22 @@ Main scheduler runner - coordinates change detection process
 """
 import asyncio
 import logging
+from collections import Counter
+
+import httpx
 from datetime import datetime, timezone, timedelta
 from typing import List, Tuple
 
-from crawler.async_scraper import get_all_book_urls_async, scrape_multiple_books
+from crawler.async_scraper import get_all_book_listings_async, scrape_multiple_books_iter
 from config.database import get_async_db, db_config
 from config.crawler_config import CrawlerConfig
-from repositories.book_repository import save_book_to_db, get_book_by_url, create_indexes, get_all_book_urls, count_books
-from repositories.changelog_repository import save_changelog, get_changelogs_by_run_id, create_changelog_indexes
-from scheduler.change_detector import detect_changes, compare_content_hashes, build_changelog_entry, categorize_books, calculate_field_statistics, generate_run_id
+from repositories.book_repository import save_books_bulk, get_books_by_urls, create_indexes, get_all_book_urls, count_books
+from repositories.changelog_repository import save_changelogs_bulk, get_changelogs_by_run_id, iter_changelogs_by_run_id, create_changelog_indexes
+from scheduler.change_detector import detect_changes, build_changelog_entry, categorize_books, generate_run_id, MONITORED_FIELDS
 from models.changelog import ChangeType, SchedulerRunSummary
-from reports.json_reporter import generate_json_report
-from reports.csv_reporter import generate_csv_report
-from notifications.email_notifier import send_email_alert
+from reports.json_reporter import generate_json_report_streamed
+from reports.csv_reporter import generate_csv_report_async
+from notifications.email_notifier import send_email_alert_async
 
 UTC_PLUS_1 = timezone(timedelta(hours=1))
 
@@ -30,17 +33,26 @@ async def process_new_books(
     db,
     new_book_urls: List[str],
     run_id: str,
-    config: CrawlerConfig
+    config: CrawlerConfig,
+    semaphore: asyncio.Semaphore = None,
+    changed_at: datetime = None,
+    client: httpx.AsyncClient = None,
+    site_listings: dict = None
 ) -> Tuple[int, int]:
     """
     Process and save new books that don't exist in database
-    
+
     Args:
         db: MongoDB database instance
         new_book_urls: List of URLs for new books
         run_id: Scheduler run ID
         config: Crawler configuration
-        
+        semaphore: Optional shared HTTP concurrency limit
+        changed_at: Timestamp stamped on changelog entries (defaults to now)
+        client: Optional shared HTTP client for connection reuse
+        site_listings: Optional url -> listing_hash mapping from the catalog
+            pages, persisted with each book for the next run's pre-filter
+
     Returns:
         Tuple of (successfully_added, failed)
     """
@@ -49,42 +61,47 @@ async def process_new_books(
         return 0, 0
     
     logger.info(f"Processing {len(new_book_urls)} new books")
-    
+
     successfully_added = 0
-    failed = 0
-    
-    scraped_books = await scrape_multiple_books(new_book_urls, config.max_concurrent_requests)
-    
-    for book_data in scraped_books:
-        try:
-            # Save book to database
-            success = await save_book_to_db(db, book_data)
-            
-            if success:
-                # Create changelog entry for new book
-                changelog = build_changelog_entry(
-                    book_source_url=book_data['source_url'],
-                    book_name=book_data['name'],
-                    change_type=ChangeType.ADDED,
-                    changes=None,
-                    detection_run_id=run_id
-                )
-                
-                await save_changelog(db, changelog)
-                successfully_added += 1
-                logger.info(f"Added new book: {book_data['name']}")
-            else:
-                failed += 1
-                
-        except Exception as e:
-            logger.error(f"Error processing new book {book_data.get('source_url', 'unknown')}: {e}")
-            failed += 1
-    
-    scrape_failed = len(new_book_urls) - len(scraped_books)
-    failed += scrape_failed
-    
+    batch = []
+
+    async def flush_batch(books):
+        """Bulk-save one batch of books plus their changelog entries"""
+        saved_books = await save_books_bulk(db, books, config.db_batch_size)
+
+        new_changelogs = [
+            build_changelog_entry(
+                book_source_url=book_data['source_url'],
+                book_name=book_data['name'],
+                change_type=ChangeType.ADDED,
+                changes=None,
+                detection_run_id=run_id,
+                changed_at=changed_at
+            )
+            for book_data in saved_books
+        ]
+
+        await save_changelogs_bulk(db, new_changelogs)
+        return len(saved_books)
+
+    # Drain scrape results as they complete, flushing a bulk write per
+    # db_batch_size books while the remaining requests are still in flight
+    async for book_data in scrape_multiple_books_iter(new_book_urls, config.max_concurrent_requests, semaphore, client):
+        if site_listings:
+            book_data['listing_hash'] = site_listings.get(book_data['source_url'])
+        batch.append(book_data)
+
+        if len(batch) >= config.db_batch_size:
+            successfully_added += await flush_batch(batch)
+            batch = []
+
+    if batch:
+        successfully_added += await flush_batch(batch)
+
+    failed = len(new_book_urls) - successfully_added
+
     logger.info(f"New books summary: {successfully_added} added, {failed} failed")
-    
+
     return successfully_added, failed
 
 
@@ -92,87 +109,148 @@ async def process_existing_books(
     db,
     existing_book_urls: List[str],
     run_id: str,
-    config: CrawlerConfig
-) -> Tuple[int, int, List[dict]]:
+    config: CrawlerConfig,
+    semaphore: asyncio.Semaphore = None,
+    changed_at: datetime = None,
+    client: httpx.AsyncClient = None,
+    site_listings: dict = None
+) -> Tuple[int, int, List[dict], dict]:
     """
     Check existing books for changes
-    
+
     Args:
         db: MongoDB database instance
         existing_book_urls: List of URLs for existing books
         run_id: Scheduler run ID
         config: Crawler configuration
-        
+        semaphore: Optional shared HTTP concurrency limit
+        changed_at: Timestamp stamped on changelog entries (defaults to now)
+        client: Optional shared HTTP client for connection reuse
+        site_listings: Optional url -> listing_hash mapping from the catalog
+            pages; books whose stored listing hash still matches skip the
+            detail-page fetch entirely
+
     Returns:
-        Tuple of (books_updated, books_unchanged, list_of_changelogs)
+        Tuple of (books_updated, books_unchanged, list_of_changelogs, field_stats)
     """
     if not existing_book_urls:
         logger.info("No existing books to check")
-        return 0, 0, []
-    
+        return 0, 0, [], {}
+
     logger.info(f"Checking {len(existing_book_urls)} existing books for changes")
-    
+
     books_updated = 0
     books_unchanged = 0
+    scraped_count = 0
     all_changelogs = []
-    
-    scraped_books = await scrape_multiple_books(existing_book_urls, config.max_concurrent_requests)
-    
-    scraped_books_dict = {book['source_url']: book for book in scraped_books}
-    
-    for url in existing_book_urls:
+    books_to_update = []
+    field_stats = Counter()
+
+    # Fetch all old books with one $in query instead of a round-trip per URL;
+    # only the fields change detection actually compares
+    old_books = await get_books_by_urls(
+        db,
+        existing_book_urls,
+        projection={field: 1 for field in ('source_url', 'content_hash', 'listing_hash', *MONITORED_FIELDS)}
+    )
+
+    # Pre-filter on the catalog listing hash: an unchanged listing row
+    # proves the monitored fields didn't change, so those books never
+    # need their detail page fetched at all
+    if site_listings:
+        urls_to_scrape = []
+        for url in existing_book_urls:
+            old_book = old_books.get(url)
+            old_listing = old_book.get('listing_hash') if old_book else None
+            if old_listing and old_listing == site_listings.get(url):
+                books_unchanged += 1
+            else:
+                urls_to_scrape.append(url)
+
+        skipped = len(existing_book_urls) - len(urls_to_scrape)
+        if skipped:
+            logger.info(f"Skipped detail fetch for {skipped} books with unchanged listing rows")
+    else:
+        urls_to_scrape = existing_book_urls
+
+    # Drain scrape results as they complete so change detection and bulk
+    # writes overlap with the remaining in-flight requests
+    async for new_book_data in scrape_multiple_books_iter(urls_to_scrape, config.max_concurrent_requests, semaphore, client):
+        url = new_book_data['source_url']
+        scraped_count += 1
+        if site_listings:
+            new_book_data['listing_hash'] = site_listings.get(url)
+
         try:
-            # Get new book data
-            new_book_data = scraped_books_dict.get(url)
-            
-            if not new_book_data:
-                logger.warning(f"Failed to scrape {url}, skipping change detection")
-                continue
-            
-            # Get old book from database
-            old_book = await get_book_by_url(db, url)
-            
+            # Get old book from the batch-fetched lookup
+            old_book = old_books.get(url)
+
             if not old_book:
                 logger.warning(f"Book {url} not found in database, skipping")
                 continue
-            
-            # Quick hash check
-            if compare_content_hashes(old_book, new_book_data):
-                # Hashes differ - something changed, find out what
-                changes = detect_changes(old_book, new_book_data)
-                
-                if changes:
-                    # Update book in database
-                    await save_book_to_db(db, new_book_data)
-                    
-                    # Create changelog entry
-                    changelog = build_changelog_entry(
-                        book_source_url=url,
-                        book_name=new_book_data['name'],
-                        change_type=ChangeType.UPDATED,
-                        changes=changes,
-                        detection_run_id=run_id
-                    )
-                    
-                    await save_changelog(db, changelog)
-                    all_changelogs.append(changelog)
-                    
-                    books_updated += 1
-                    
-                    changed_fields = ', '.join(changes.keys())
-                    logger.info(f"Updated book: {new_book_data['name']} (changed: {changed_fields})")
-                else:
-                    books_unchanged += 1
+
+            # Matching content hashes mean no monitored field changed - skip
+            # the field-by-field diff entirely (hash comes from the batched
+            # projection, so this costs one string compare per book)
+            old_hash = old_book.get('content_hash')
+            if old_hash and old_hash == new_book_data.get('content_hash'):
+                books_unchanged += 1
+                # Persist the fresh listing hash so the next run can skip
+                # this book without a detail fetch
+                if site_listings and old_book.get('listing_hash') != new_book_data.get('listing_hash'):
+                    books_to_update.append(new_book_data)
+                continue
+
+            changes = detect_changes(old_book, new_book_data)
+
+            if changes:
+                # Count field changes here rather than re-scanning the
+                # changelog list at the end of the run (keys only -
+                # Counter.update with the mapping would merge the
+                # FieldChange dicts as counts)
+                field_stats.update(changes.keys())
+
+                # Queue book update for the periodic bulk flush
+                books_to_update.append(new_book_data)
+
+                # Create changelog entry
+                changelog = build_changelog_entry(
+                    book_source_url=url,
+                    book_name=new_book_data['name'],
+                    change_type=ChangeType.UPDATED,
+                    changes=changes,
+                    detection_run_id=run_id,
+                    changed_at=changed_at
+                )
+
+                all_changelogs.append(changelog)
+
+                books_updated += 1
+
+                changed_fields = ', '.join(changes.keys())
+                logger.info(f"Updated book: {new_book_data['name']} (changed: {changed_fields})")
+
+                if len(books_to_update) >= config.db_batch_size:
+                    await save_books_bulk(db, books_to_update, config.db_batch_size)
+                    books_to_update = []
             else:
                 books_unchanged += 1
-                
+
         except Exception as e:
             logger.error(f"Error processing book {url}: {e}")
             continue
-    
+
+    scrape_failed = len(urls_to_scrape) - scraped_count
+    if scrape_failed:
+        logger.warning(f"Failed to scrape {scrape_failed} existing books, skipped change detection for them")
+
+    # Flush remaining book updates and all changelogs
+    await save_books_bulk(db, books_to_update, config.db_batch_size)
+    await save_changelogs_bulk(db, all_changelogs)
+
     logger.info(f"Existing books summary: {books_updated} updated, {books_unchanged} unchanged")
-    
-    return books_updated, books_unchanged, all_changelogs
+
+    return books_updated, books_unchanged, all_changelogs, dict(field_stats)
 
 
 async def run_change_detection(config: CrawlerConfig = None):
@@ -193,42 +271,50 @@ async def run_change_detection(config: CrawlerConfig = None):
     logger.info("="*60)
     
     db = await get_async_db()
-    
+
     await create_indexes(db)
     await create_changelog_indexes(db)
-    
+
+    # One client for the whole run: URL discovery and both processors share
+    # its keep-alive connection pool and DNS cache instead of re-handshaking
+    # per phase
+    http_client = httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=config.max_concurrent_requests,
+            max_keepalive_connections=config.max_concurrent_requests
+        )
+    )
+
     try:
-        # Get initial book count
-        books_in_db_before = await count_books(db)
-        logger.info(f"Books in database before: {books_in_db_before}")
-        
-        # Get all book URLs from website
-        logger.info("Fetching book URLs from website...")
-        site_urls = await get_all_book_urls_async(config.base_url)
+        # Initial book count, site URLs, and DB URLs have no data
+        # dependency - run all three concurrently
+        logger.info("Fetching book count and URLs from database and website...")
+        books_in_db_before, site_listings, db_urls = await asyncio.gather(
+            count_books(db),
+            get_all_book_listings_async(config.base_url, http_client),
+            get_all_book_urls(db),
+        )
+
+        site_urls = list(site_listings)
         total_books_on_site = len(site_urls)
+        logger.info(f"Books in database before: {books_in_db_before}")
         logger.info(f"Found {total_books_on_site} books on website")
-        
-        # Get all book URLs from database
-        logger.info("Fetching book URLs from database...")
-        db_urls = await get_all_book_urls(db)
         logger.info(f"Found {len(db_urls)} books in database")
         
         # Categorize books
         new_book_urls, existing_book_urls = categorize_books(site_urls, db_urls)
         
-        # Process new books
-        new_books_added, new_books_failed = await process_new_books(
-            db, new_book_urls, run_id, config
-        )
-        
-        # Process existing books
-        books_updated, books_unchanged, changelogs = await process_existing_books(
-            db, existing_book_urls, run_id, config
+        # One shared semaphore keeps total in-flight HTTP requests at the
+        # configured limit even with both processors running at once
+        http_semaphore = asyncio.BoundedSemaphore(config.max_concurrent_requests)
+
+        # Process new and existing books concurrently - they work on
+        # disjoint URL sets and disjoint documents
+        (new_books_added, new_books_failed), (books_updated, books_unchanged, changelogs, field_stats) = await asyncio.gather(
+            process_new_books(db, new_book_urls, run_id, config, http_semaphore, started_at, http_client, site_listings),
+            process_existing_books(db, existing_book_urls, run_id, config, http_semaphore, started_at, http_client, site_listings),
         )
-        
-        # Calculate field statistics
-        field_stats = calculate_field_statistics(changelogs)
-        
+
         # Get final book count
         books_in_db_after = await count_books(db)
         
@@ -278,20 +364,21 @@ async def run_change_detection(config: CrawlerConfig = None):
         logger.info("Generating reports...")
         
         try:
-            # Get all changelogs for this run
+            # The CSV writer runs in a worker thread and needs the
+            # materialized list; the JSON report streams straight from
+            # its own cursor and never holds the run's changes in memory
             all_changelogs = await get_changelogs_by_run_id(db, run_id)
-            
-            # Generate JSON report
-            json_report_path = generate_json_report(summary, all_changelogs)
+
+            json_report_path, csv_report_path = await asyncio.gather(
+                generate_json_report_streamed(summary, iter_changelogs_by_run_id(db, run_id)),
+                generate_csv_report_async(summary, all_changelogs)
+            )
             logger.info(f"JSON report: {json_report_path}")
-            
-            # Generate CSV report
-            csv_report_path = generate_csv_report(summary, all_changelogs)
             logger.info(f"CSV report: {csv_report_path}")
-            
+
             # Send email alert with reports attached
             logger.info("Sending email alert...")
-            email_sent = send_email_alert(
+            email_sent = await send_email_alert_async(
                 summary,
                 report_files=[json_report_path, csv_report_path],
                 force_send=False  # Only send if changes detected
@@ -313,6 +400,7 @@ async def run_change_detection(config: CrawlerConfig = None):
         logger.error(f"Fatal error during change detection: {e}")
         raise
     finally:
+        await http_client.aclose()
         await db_config.close_async()
 
 
@@ -3,6 +3,7 @@ Test scheduler with immediate execution
 """
 import asyncio
 import logging
+import signal
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 
 from scheduler.runner import run_change_detection
@@ -45,10 +46,22 @@ async def test_scheduler_every_minute():
     scheduler.start()
     logger.info("Scheduler started. Will run every minute. Press Ctrl+C to stop.")
     
+    # Wait on an Event instead of polling asyncio.sleep in a loop
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+
+    try:
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, stop_event.set)
+    except NotImplementedError:
+        # Signal handlers aren't available on Windows event loops
+        pass
+
     try:
-        while True:
-            await asyncio.sleep(10)
+        await stop_event.wait()
     except KeyboardInterrupt:
+        pass
+    finally:
         logger.info("Stopping scheduler...")
         scheduler.shutdown()
 
@@ -1,22 +1,119 @@
 """
 Pytest configuration and fixtures
 """
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import httpx
 import pytest
 import pytest_asyncio
+from mongomock_motor import AsyncMongoMockClient
+from api.main import app
 from config.database import get_async_db
 
+UTC_PLUS_1 = timezone(timedelta(hours=1))
+
+
+def _seed_books():
+    """Representative book documents for the in-memory test database"""
+    categories = ['Fiction', 'Poetry', 'Travel', 'Mystery', 'History']
+    now = datetime.now(UTC_PLUS_1)
+
+    return [
+        {
+            'name': f'Seed Book {i}',
+            'description': f'Description for seed book {i}',
+            'category': categories[i % len(categories)],
+            'price_incl_tax': 5.0 + i,
+            'price_excl_tax': 5.0 + i,
+            'availability': 'In stock',
+            'number_of_reviews': i % 10,
+            'image_url': f'https://example.com/seed-{i}.jpg',
+            'rating': (i % 5) + 1,
+            'source_url': f'https://books.toscrape.com/catalogue/seed-{i}/index.html',
+            'crawled_at': now,
+            'updated_at': now,
+            'status': 'active',
+            'content_hash': f'{i:064d}',
+        }
+        for i in range(50)
+    ]
+
+
+def _seed_changelogs():
+    """Representative changelog documents for the in-memory test database"""
+    now = datetime.now(UTC_PLUS_1)
+
+    return [
+        {
+            'book_source_url': f'https://books.toscrape.com/catalogue/seed-{i}/index.html',
+            'book_name': f'Seed Book {i}',
+            'change_type': 'added' if i % 2 == 0 else 'updated',
+            'changes': None if i % 2 == 0 else {
+                'price_incl_tax': {'old': 5.0 + i, 'new': 6.0 + i}
+            },
+            'changed_at': now - timedelta(days=i % 7),
+            'detection_run_id': f'run_2026-08-{20 + (i % 5):02d}_02-00-00',
+        }
+        for i in range(30)
+    ]
+
+
+# Built once at import - every test sees the same deterministic dataset
+# (50 books: 10 per category, prices 5.0-54.0; 30 changelogs: 15 added,
+# 15 updated), so tests can assert exact totals instead of guarding on
+# whatever data happens to be present
+BOOK_FIXTURES = _seed_books()
+CHANGELOG_FIXTURES = _seed_changelogs()
+
 
+@pytest.fixture(scope="session")
+def client():
+    """Shared async test client - routes requests straight through the
+    ASGI app, no per-request thread or portal like TestClient"""
+    return httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app),
+        base_url="http://test"
+    )
 
-@pytest_asyncio.fixture(scope="function")  
+
+@pytest_asyncio.fixture(scope="function")
 async def db():
     """
-    Database fixture - fresh connection per test
+    Database fixture - in-process mongomock database, pre-seeded
+
+    Service tests run against in-memory dicts instead of paying a
+    MongoDB round-trip per assertion.
+    """
+    database = AsyncMongoMockClient()['crawler_test']
+    # Shallow copies: insert_many stamps _id on the docs and tests may
+    # mutate them, the shared fixtures must stay pristine. The two
+    # collections are independent, so seed them concurrently
+    await asyncio.gather(
+        database.books.insert_many([{**book} for book in BOOK_FIXTURES]),
+        database.changelogs.insert_many([{**entry} for entry in CHANGELOG_FIXTURES])
+    )
+    yield database
+
+
+@pytest_asyncio.fixture(scope="function")
+async def real_db():
+    """
+    Real database connection - only for tests marked integration
     """
     database = await get_async_db()
     yield database
     # Connection managed by get_async_db
 
 
+@pytest.fixture(scope="session")
+def date_window():
+    """(start, end) ISO pair for the last 7 days - computed once so both
+    date-range tests query the exact same window"""
+    now = datetime.now(timezone.utc)
+    return (now - timedelta(days=7)).isoformat(), now.isoformat()
+
+
 @pytest.fixture
 def sample_book_data():
     """Sample book data for testing"""
@@ -35,9 +132,9 @@ def sample_book_data():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def api_key():
-    """Valid API key for testing"""
+    """Valid API key for testing - read once per session"""
     import os
     from dotenv import load_dotenv
     
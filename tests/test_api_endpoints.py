@@ -2,27 +2,19 @@
 Tests for API endpoints
 """
 import pytest
-from fastapi.testclient import TestClient
-from api.main import app
 
 
-@pytest.fixture
-def client():
-    """Test client fixture"""
-    return TestClient(app)
-
-
-def test_root_endpoint(client):
+async def test_root_endpoint(client):
     """Test root endpoint"""
-    response = client.get("/")
+    response = await client.get("/")
     
     assert response.status_code == 200
     assert "message" in response.json()
 
 
-def test_health_endpoint(client):
+async def test_health_endpoint(client):
     """Test health check endpoint (no auth required)"""
-    response = client.get("/health")
+    response = await client.get("/health")
     
     assert response.status_code == 200
     data = response.json()
@@ -30,17 +22,17 @@ def test_health_endpoint(client):
     assert 'total_books' in data
 
 
-def test_books_without_auth(client):
+async def test_books_without_auth(client):
     """Test that books endpoint requires authentication"""
-    response = client.get("/books")
+    response = await client.get("/books")
     
     assert response.status_code == 401
     assert "API key" in response.json()['detail']
 
 
-def test_books_with_auth(client, api_key):
+async def test_books_with_auth(client, api_key):
     """Test books endpoint with valid API key"""
-    response = client.get(
+    response = await client.get(
         "/books?page_size=5",
         headers={"X-API-Key": api_key}
     )
@@ -52,10 +44,10 @@ def test_books_with_auth(client, api_key):
     assert len(data['data']) <= 5
 
 
-def test_books_with_filters(client, api_key):
+async def test_books_with_filters(client, api_key):
     """Test books endpoint with filters"""
-    response = client.get(
-        "/books?category=Fiction&page_size=5",
+    response = await client.get(
+        "/books?category=Fiction&page_size=5&fields=category",
         headers={"X-API-Key": api_key}
     )
     
@@ -64,15 +56,15 @@ def test_books_with_filters(client, api_key):
     
     if data['data']:
         for book in data['data']:
-            assert book['category'].lower() == 'fiction'
+            assert book['category'].casefold() == 'fiction'
 
 
 
 
 
-def test_invalid_api_key(client):
+async def test_invalid_api_key(client):
     """Test with invalid API key"""
-    response = client.get(
+    response = await client.get(
         "/books",
         headers={"X-API-Key": "invalid_key_12345"}
     )
@@ -80,9 +72,9 @@ def test_invalid_api_key(client):
     assert response.status_code == 401
 
 
-def test_get_book_by_id_invalid_format(client, api_key):
+async def test_get_book_by_id_invalid_format(client, api_key):
     """Test get book by ID with invalid format"""
-    response = client.get(
+    response = await client.get(
         "/books/invalid_id_format",
         headers={"X-API-Key": api_key}
     )
@@ -90,9 +82,9 @@ def test_get_book_by_id_invalid_format(client, api_key):
     assert response.status_code == 404
 
 
-def test_get_book_by_id_not_found(client, api_key):
+async def test_get_book_by_id_not_found(client, api_key):
     """Test get book by ID that doesn't exist"""
-    response = client.get(
+    response = await client.get(
         "/books/555f1f77bcf86cd799439022",  # Valid format but book doesn't exist
         headers={"X-API-Key": api_key}
     )
@@ -100,9 +92,9 @@ def test_get_book_by_id_not_found(client, api_key):
     assert response.status_code == 404
 
 
-def test_get_categories_endpoint(client, api_key):
+async def test_get_categories_endpoint(client, api_key):
     """Test get all categories endpoint"""
-    response = client.get(
+    response = await client.get(
         "/books/categories/list",
         headers={"X-API-Key": api_key}
     )
@@ -112,9 +104,9 @@ def test_get_categories_endpoint(client, api_key):
     assert isinstance(categories, list)
 
 
-def test_books_with_price_filter(client, api_key):
+async def test_books_with_price_filter(client, api_key):
     """Test books with min and max price filters"""
-    response = client.get(
+    response = await client.get(
         "/books?min_price=10&max_price=20&page_size=5",
         headers={"X-API-Key": api_key}
     )
@@ -127,9 +119,9 @@ def test_books_with_price_filter(client, api_key):
             assert 10 <= book['price_incl_tax'] <= 20
 
 
-def test_books_with_rating_filter(client, api_key):
+async def test_books_with_rating_filter(client, api_key):
     """Test books with rating filter"""
-    response = client.get(
+    response = await client.get(
         "/books?rating=4&page_size=5",
         headers={"X-API-Key": api_key}
     )
@@ -142,11 +134,11 @@ def test_books_with_rating_filter(client, api_key):
             assert book['rating'] == 4
 
 
-def test_books_with_sorting(client, api_key):
+async def test_books_with_sorting(client, api_key):
     """Test books with different sort options"""
-    # Sort by price
-    response = client.get(
-        "/books?sort_by=price&page_size=5",
+    # Sort by price, projecting down to the one field the test checks
+    response = await client.get(
+        "/books?sort_by=price&page_size=5&fields=price_incl_tax",
         headers={"X-API-Key": api_key}
     )
     
@@ -158,29 +150,76 @@ def test_books_with_sorting(client, api_key):
         assert prices == sorted(prices)
 
 
-def test_books_pagination_last_page(client, api_key):
+async def test_books_pagination_last_page(client, api_key):
     """Test accessing last page of books"""
-    # Get total pages first
-    response = client.get(
-        "/books?page_size=50",
+    # Count-only request: learn total_pages without fetching 50 docs
+    response = await client.get(
+        "/books?count_only=true&page_size=50",
         headers={"X-API-Key": api_key}
     )
-    
+
     data = response.json()
+    assert data['data'] == []
     last_page = data['total_pages']
-    
+
     # Request last page
-    response = client.get(
+    response = await client.get(
         f"/books?page={last_page}&page_size=50",
         headers={"X-API-Key": api_key}
     )
-    
+
+    assert response.status_code == 200
+
+
+async def test_books_keyset_pagination(client, api_key):
+    """Test keyset pagination with after_id cursor"""
+    response = await client.get(
+        "/books?after_id=000000000000000000000000&page_size=5",
+        headers={"X-API-Key": api_key}
+    )
+
     assert response.status_code == 200
+    data = response.json()
+
+    if data['data']:
+        # Cursor points at the last returned book, ids ascend
+        assert data['next_cursor'] == data['data'][-1]['id']
+        ids = [book['id'] for book in data['data']]
+        assert ids == sorted(ids)
+
+        # Follow the cursor - no overlap with the first page
+        response = await client.get(
+            f"/books?after_id={data['next_cursor']}&page_size=5",
+            headers={"X-API-Key": api_key}
+        )
+        assert response.status_code == 200
+        next_ids = [book['id'] for book in response.json()['data']]
+        assert not set(ids) & set(next_ids)
+
+
+async def test_books_keyset_invalid_cursor(client, api_key):
+    """Test keyset pagination with malformed after_id"""
+    response = await client.get(
+        "/books?after_id=not_an_object_id",
+        headers={"X-API-Key": api_key}
+    )
+
+    assert response.status_code == 422
+
+
+async def test_books_unknown_fields(client, api_key):
+    """Test fields projection rejects names outside the allowlist"""
+    response = await client.get(
+        "/books?fields=category,content_hash",
+        headers={"X-API-Key": api_key}
+    )
+
+    assert response.status_code == 422
 
 
-def test_books_invalid_price_range(client, api_key):
+async def test_books_invalid_price_range(client, api_key):
     """Test books with invalid price range (min > max)"""
-    response = client.get(
+    response = await client.get(
         "/books?min_price=50&max_price=10",
         headers={"X-API-Key": api_key}
     )
@@ -188,10 +227,11 @@ def test_books_invalid_price_range(client, api_key):
     assert response.status_code == 422
 
 
-def test_books_multiple_filters(client, api_key):
+async def test_books_multiple_filters(client, api_key):
     """Test books with multiple filters combined"""
-    response = client.get(
-        "/books?category=Fiction&min_price=10&rating=4&page_size=5",
+    response = await client.get(
+        "/books?category=Fiction&min_price=10&rating=4&page_size=5"
+        "&fields=category,price_incl_tax,rating",
         headers={"X-API-Key": api_key}
     )
     
@@ -200,6 +240,6 @@ def test_books_multiple_filters(client, api_key):
     
     if data['data']:
         for book in data['data']:
-            assert book['category'].lower() == 'fiction'
+            assert book['category'].casefold() == 'fiction'
             assert book['price_incl_tax'] >= 10
             assert book['rating'] == 4
\ No newline at end of file
@@ -1,20 +1,14 @@
 """
 Tests for API key management endpoints
 """
-import pytest
-from fastapi.testclient import TestClient
-from api.main import app
-
+import asyncio
 
-@pytest.fixture
-def client():
-    """Test client fixture"""
-    return TestClient(app)
+import pytest
 
 
-def test_create_api_key(client):
+async def test_create_api_key(client):
     """Test creating a new API key"""
-    response = client.post(
+    response = await client.post(
         "/admin/api-keys",
         json={"name": "Test Application"}
     )
@@ -28,10 +22,10 @@ def test_create_api_key(client):
     assert data['key'].startswith('key_')
 
 
-def test_create_api_key_and_use_it(client):
+async def test_create_api_key_and_use_it(client):
     """Test creating API key and using it for authentication"""
     # Create key
-    response = client.post(
+    response = await client.post(
         "/admin/api-keys",
         json={"name": "Test Key"}
     )
@@ -41,7 +35,7 @@ def test_create_api_key_and_use_it(client):
     new_key = key_data['key']
     
     # Use the new key to access protected endpoint
-    response = client.get(
+    response = await client.get(
         "/books?page_size=5",
         headers={"X-API-Key": new_key}
     )
@@ -49,19 +43,19 @@ def test_create_api_key_and_use_it(client):
     assert response.status_code == 200
 
 
-def test_list_api_keys(client):
+async def test_list_api_keys(client):
     """Test listing all API keys"""
-    response = client.get("/admin/api-keys")
+    response = await client.get("/admin/api-keys")
     
     assert response.status_code == 200
     keys = response.json()
     assert isinstance(keys, list)
 
 
-def test_revoke_api_key(client):
+async def test_revoke_api_key(client):
     """Test revoking an API key"""
     # First create a key
-    response = client.post(
+    response = await client.post(
         "/admin/api-keys",
         json={"name": "Key to Revoke"}
     )
@@ -70,43 +64,53 @@ def test_revoke_api_key(client):
     key_data = response.json()
     
     # List keys to get the ID
-    response = client.get("/admin/api-keys")
+    response = await client.get("/admin/api-keys")
     keys = response.json()
     
     if keys:
         key_id = keys[-1]['id']  # Get last created key
         
         # Revoke it
-        response = client.delete(f"/admin/api-keys/{key_id}")
+        response = await client.delete(f"/admin/api-keys/{key_id}")
         assert response.status_code == 200
 
 
-def test_revoke_nonexistent_key(client):
+async def test_revoke_nonexistent_key(client):
     """Test revoking a key that doesn't exist"""
-    response = client.delete("/admin/api-keys/507f1f77bcf86cd799439011")
+    response = await client.delete("/admin/api-keys/507f1f77bcf86cd799439011")
     assert response.status_code == 404
 
 
-def test_create_multiple_keys(client):
-    """Test creating multiple API keys"""
+async def test_create_multiple_keys():
+    """Test creating multiple API keys concurrently"""
+    # Lazy imports: the app (and its driver/model imports) is loaded via
+    # conftest for the shared client; only this test needs its own
+    import httpx
+    from api.main import app
+
     names = ["App 1", "App 2", "App 3"]
+
+    # Issue the posts concurrently over the ASGI transport instead of
+    # three serial TestClient round-trips
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as ac:
+        responses = await asyncio.gather(*[
+            ac.post("/admin/api-keys", json={"name": name})
+            for name in names
+        ])
+
     created_keys = []
-    
-    for name in names:
-        response = client.post(
-            "/admin/api-keys",
-            json={"name": name}
-        )
+    for response in responses:
         assert response.status_code == 200
         created_keys.append(response.json()['key'])
-    
+
     assert len(created_keys) == 3
     assert len(set(created_keys)) == 3  # All unique
 
 
-def test_api_key_invalid_format(client):
+async def test_api_key_invalid_format(client):
     """Test using API key with invalid format"""
-    response = client.get(
+    response = await client.get(
         "/books",
         headers={"X-API-Key": "invalid_key"}
     )
@@ -9,8 +9,8 @@ from api.services.book_service import BookService
 async def test_get_all_books(db):
     """Test getting all books with pagination"""
     result = await BookService.get_books(db, page=1, page_size=10)
-    
-    assert result['total'] > 0
+
+    assert result['total'] == 50
     assert result['page'] == 1
     assert result['page_size'] == 10
     assert len(result['data']) <= 10
@@ -21,13 +21,13 @@ async def test_get_all_books(db):
 async def test_filter_by_category(db):
     """Test filtering books by category"""
     result = await BookService.get_books(db, category="Fiction", page_size=5)
-    
-    assert result['total'] >= 0
-    
-    if result['data']:
-        # If books found, verify they're Fiction
-        for book in result['data']:
-            assert book['category'].lower() == 'fiction'
+
+    # Seed data holds exactly 10 Fiction books
+    assert result['total'] == 10
+    assert len(result['data']) == 5
+
+    for book in result['data']:
+        assert book['category'].casefold() == 'fiction'
 
 
 @pytest.mark.asyncio
@@ -35,25 +35,27 @@ async def test_filter_by_price_range(db):
     """Test filtering books by price range"""
     result = await BookService.get_books(
         db, 
-        min_price=10.0, 
-        max_price=20.0, 
+        min_price=10.0,
+        max_price=20.0,
         page_size=10
     )
-    
-    if result['data']:
-        for book in result['data']:
-            assert 10.0 <= book['price_incl_tax'] <= 20.0
+
+    # Seed prices run 5.0-54.0 in steps of 1, so 11 books fall in range
+    assert result['total'] == 11
+
+    for book in result['data']:
+        assert 10.0 <= book['price_incl_tax'] <= 20.0
 
 
 @pytest.mark.asyncio
 async def test_sort_by_price(db):
     """Test sorting books by price"""
     result = await BookService.get_books(db, sort_by="price", page_size=5)
-    
-    if len(result['data']) > 1:
-        prices = [book['price_incl_tax'] for book in result['data']]
-        # Check prices are in ascending order
-        assert prices == sorted(prices)
+
+    assert len(result['data']) == 5
+    prices = [book['price_incl_tax'] for book in result['data']]
+    # Check prices are in ascending order
+    assert prices == sorted(prices)
 
 
 @pytest.mark.asyncio
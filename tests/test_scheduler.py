@@ -2,10 +2,15 @@
 Tests for scheduler and change detection
 """
 import pytest
+from mongomock_motor import AsyncMongoMockClient
+
+from config.crawler_config import CrawlerConfig
+from scheduler import runner
 from scheduler.change_detector import (
     detect_changes,
     compare_content_hashes,
     categorize_books,
+    calculate_field_statistics,
     generate_run_id
 )
 
@@ -74,13 +79,75 @@ def test_categorize_books():
     db_urls = {'book1', 'book2'}
     
     new_books, existing_books = categorize_books(site_urls, db_urls)
-    
+
+    # Order-agnostic: the partitioning is done with set operations
+    assert set(new_books) == {'book3', 'book4'}
+    assert set(existing_books) == {'book1', 'book2'}
     assert len(new_books) == 2
     assert len(existing_books) == 2
-    assert 'book3' in new_books
-    assert 'book4' in new_books
-    assert 'book1' in existing_books
-    assert 'book2' in existing_books
+
+
+async def test_process_existing_books_multiple_updates(monkeypatch):
+    """Regression: every changed book in a run is updated and counted"""
+    db = AsyncMongoMockClient()['scheduler_test']
+    urls = [f'https://books.toscrape.com/catalogue/book-{i}/index.html' for i in range(3)]
+
+    def book_doc(i, price, content_hash):
+        return {
+            'name': f'Book {i}',
+            'category': 'Fiction',
+            'price_incl_tax': price,
+            'price_excl_tax': price,
+            'availability': 'In stock',
+            'number_of_reviews': 0,
+            'rating': 3,
+            'source_url': urls[i],
+            'content_hash': content_hash,
+        }
+
+    await db.books.insert_many([book_doc(i, 10.0 + i, f'old{i}') for i in range(3)])
+    new_books = [book_doc(i, 20.0 + i, f'new{i}') for i in range(3)]
+
+    async def fake_scraper(scrape_urls, max_concurrent, semaphore=None, client=None):
+        for book in new_books:
+            yield dict(book)
+
+    saved = []
+
+    async def record_bulk_save(db_arg, books, chunk_size=500):
+        saved.extend(books)
+        return books
+
+    monkeypatch.setattr(runner, 'scrape_multiple_books_iter', fake_scraper)
+    monkeypatch.setattr(runner, 'save_books_bulk', record_bulk_save)
+
+    updated, unchanged, changelogs, field_stats = await runner.process_existing_books(
+        db, urls, 'run_test', CrawlerConfig()
+    )
+
+    # All three changed books are updated, logged, and counted - no
+    # silent drops after the first one
+    assert updated == 3
+    assert unchanged == 0
+    assert len(changelogs) == 3
+    assert len(saved) == 3
+    assert field_stats == {'price_incl_tax': 3, 'price_excl_tax': 3}
+
+
+def test_calculate_field_statistics():
+    """Field counts aggregate as integers across multiple changelogs"""
+    changelogs = [
+        {'changes': {
+            'price_incl_tax': {'old': 10.0, 'new': 12.0},
+            'availability': {'old': 'In stock', 'new': 'Out of stock'}
+        }},
+        {'changes': {'price_incl_tax': {'old': 5.0, 'new': 6.0}}},
+        {'changes': None},
+    ]
+
+    stats = calculate_field_statistics(changelogs)
+
+    assert stats == {'price_incl_tax': 2, 'availability': 1}
 
 
 def test_generate_run_id():